@@ -15,6 +15,7 @@ HEADERS_PATH = C2SWITCHER_DIR / 'headers.json'
 CLAUDE_DIR = Path.home() / '.claude'
 CREDENTIALS_PATH = CLAUDE_DIR / '.credentials.json'
 LB_STATE_PATH = C2SWITCHER_DIR / 'load_balancer_state.json'
+USAGE_CHART_HASH_PATH = C2SWITCHER_DIR / 'usage_chart.hash'
 
 # Load balancer tuning parameters
 SIMILAR_DRAIN_THRESHOLD = 0.05  # %/hour margin to consider accounts interchangeable
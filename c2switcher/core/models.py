@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from ..utils import parse_iso_timestamp
+
 
 @dataclass
 class Account:
@@ -123,7 +125,7 @@ class UsageWindow:
         if not self.resets_at:
             return 168.0  # 7 days fallback
         try:
-            reset_dt = datetime.fromisoformat(self.resets_at.replace('Z', '+00:00'))
+            reset_dt = parse_iso_timestamp(self.resets_at)
             if reset_dt.tzinfo is None:
                 reset_dt = reset_dt.replace(tzinfo=timezone.utc)
             hours = (reset_dt - datetime.now(timezone.utc)).total_seconds() / 3600.0
@@ -221,8 +223,8 @@ class Session:
         if not self.created_at or not self.ended_at:
             return None
         try:
-            created = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
-            ended = datetime.fromisoformat(self.ended_at.replace('Z', '+00:00'))
+            created = parse_iso_timestamp(self.created_at)
+            ended = parse_iso_timestamp(self.ended_at)
             return (ended - created).total_seconds()
         except Exception:
             return None
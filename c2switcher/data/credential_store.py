@@ -6,7 +6,7 @@ import copy
 import json
 import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 import requests
 
@@ -57,17 +57,18 @@ class CredentialStore:
         now_ms = int(time.time() * 1000)
         return expires_at - self.REFRESH_BUFFER_MS > now_ms
 
-    def refresh_access_token(self, credentials_json: str, force: bool = False) -> Dict:
+    def refresh_access_token(self, credentials_json: str, force: bool = False) -> Tuple[Dict, bool]:
         """
         Refresh OAuth access token.
 
-        Returns updated credentials dict with new access token.
+        Returns (credentials, refreshed): the credentials dict with a valid access token, and whether it was
+        refreshed (False when the stored token was still fresh and is returned unchanged).
         Raises TokenUnavailable if refresh fails.
         """
         creds = self.parse_credentials(credentials_json)
 
         if self.is_token_fresh(creds, force):
-            return creds
+            return creds, False
 
         oauth = creds.get('claudeAiOauth', {})
         refresh_token = oauth.get('refreshToken')
@@ -112,7 +113,7 @@ class CredentialStore:
             )
 
             console.print('[green]Token refreshed successfully[/green]')
-            return new_creds
+            return new_creds, True
 
         except requests.RequestException as exc:
             raise TokenUnavailable(f'OAuth request failed: {exc}')
@@ -177,7 +178,7 @@ class CredentialStore:
         Returns:
            Updated credentials dict
         """
-        refreshed = self.refresh_access_token(credentials_json, force=force)
+        refreshed, _ = self.refresh_access_token(credentials_json, force=force)
 
         if not dry_run:
             self.write_credentials(refreshed)
@@ -194,7 +195,7 @@ class CredentialStore:
         Raises:
            TokenUnavailable: If token cannot be obtained
         """
-        refreshed = self.refresh_access_token(credentials_json, force=force)
+        refreshed, _ = self.refresh_access_token(credentials_json, force=force)
         token = refreshed.get('claudeAiOauth', {}).get('accessToken')
 
         if not token:
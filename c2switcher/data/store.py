@@ -10,6 +10,23 @@ from typing import Dict, List, Optional, Tuple
 
 from ..constants import C2SWITCHER_DIR, DB_PATH, DEFAULT_BURST_BUFFER
 from ..core.models import Account, Session, UsageSnapshot
+from ..utils import parse_iso_timestamp
+
+
+def _cache_age_seconds(queried_at: Optional[str], queried_at_epoch: Optional[float]) -> float:
+    """Age of a usage row, preferring the stored epoch over parsing queried_at."""
+    if queried_at_epoch is not None:
+        return max(time.time() - queried_at_epoch, 0.0)
+
+    from datetime import datetime, timezone
+
+    try:
+        cache_dt = parse_iso_timestamp(queried_at)
+        if cache_dt.tzinfo is None:
+            cache_dt = cache_dt.replace(tzinfo=timezone.utc)
+        return max((datetime.now(timezone.utc) - cache_dt).total_seconds(), 0)
+    except Exception:
+        return 0.0
 
 
 class Store:
@@ -147,6 +164,14 @@ class Store:
          """
         )
 
+        cursor.execute(
+            """
+         CREATE INDEX IF NOT EXISTS idx_sessions_ended_created
+         ON sessions(created_at)
+         WHERE ended_at IS NOT NULL
+         """
+        )
+
         cursor.execute(
             """
          CREATE INDEX IF NOT EXISTS idx_sessions_account
@@ -172,6 +197,14 @@ class Store:
         if 'seven_day_sonnet_resets_at' not in columns:
             cursor.execute('ALTER TABLE usage_history ADD COLUMN seven_day_sonnet_resets_at TEXT')
 
+        # Migration: add queried_at_epoch so cache age needs no timestamp parsing
+        if 'queried_at_epoch' not in columns:
+            cursor.execute('ALTER TABLE usage_history ADD COLUMN queried_at_epoch REAL')
+            cursor.execute(
+                "UPDATE usage_history SET queried_at_epoch = CAST(strftime('%s', queried_at) AS REAL) "
+                'WHERE queried_at_epoch IS NULL'
+            )
+
         # Migration: add api_key column to accounts if it doesn't exist
         cursor.execute('PRAGMA table_info(accounts)')
         account_columns = {row[1] for row in cursor.fetchall()}
@@ -205,29 +238,19 @@ class Store:
             cursor = self.conn.cursor()
             cursor.execute(
                 """
-            SELECT raw_response, queried_at
+            SELECT raw_response, queried_at, queried_at_epoch
             FROM usage_history
             WHERE account_uuid = ?
-            AND strftime('%s', queried_at) > ?
+            AND queried_at_epoch > ?
             ORDER BY queried_at DESC LIMIT 1
             """,
-                (account.uuid, str(int(cutoff_time))),
+                (account.uuid, cutoff_time),
             )
             row = cursor.fetchone()
             if row:
                 usage_data = json.loads(row[0])
                 queried_at = row[1]
-
-                # Compute cache age
-                from datetime import datetime, timezone
-
-                try:
-                    cache_dt = datetime.fromisoformat(queried_at.replace('Z', '+00:00'))
-                    if cache_dt.tzinfo is None:
-                        cache_dt = cache_dt.replace(tzinfo=timezone.utc)
-                    cache_age = max((datetime.now(timezone.utc) - cache_dt).total_seconds(), 0)
-                except Exception:
-                    cache_age = 0.0
+                cache_age = _cache_age_seconds(queried_at, row[2])
 
                 usage_data['_cache_source'] = 'cache'
                 usage_data['_cache_age_seconds'] = cache_age
@@ -484,8 +507,8 @@ class Store:
             seven_day_utilization, seven_day_resets_at,
             seven_day_opus_utilization, seven_day_opus_resets_at,
             seven_day_sonnet_utilization, seven_day_sonnet_resets_at,
-            raw_response
-         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            raw_response, queried_at_epoch
+         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
          """,
             (
                 account_uuid,
@@ -498,6 +521,7 @@ class Store:
                 seven_day_sonnet.get('utilization'),
                 seven_day_sonnet.get('resets_at'),
                 json.dumps(usage_data),
+                time.time(),
             ),
         )
         self.conn.commit()
@@ -528,25 +552,25 @@ class Store:
         if require_data:
             cursor.execute(
                 """
-            SELECT raw_response, queried_at
+            SELECT raw_response, queried_at, queried_at_epoch
             FROM usage_history
             WHERE account_uuid = ?
-            AND strftime('%s', queried_at) > ?
+            AND queried_at_epoch > ?
             AND (seven_day_utilization IS NOT NULL OR seven_day_sonnet_utilization IS NOT NULL)
             ORDER BY queried_at DESC LIMIT 1
             """,
-                (account_uuid, str(int(cutoff_time))),
+                (account_uuid, cutoff_time),
             )
         else:
             cursor.execute(
                 """
-            SELECT raw_response, queried_at
+            SELECT raw_response, queried_at, queried_at_epoch
             FROM usage_history
             WHERE account_uuid = ?
-            AND strftime('%s', queried_at) > ?
+            AND queried_at_epoch > ?
             ORDER BY queried_at DESC LIMIT 1
             """,
-                (account_uuid, str(int(cutoff_time))),
+                (account_uuid, cutoff_time),
             )
 
         row = cursor.fetchone()
@@ -555,17 +579,7 @@ class Store:
 
         usage_data = json.loads(row[0])
         queried_at = row[1]
-
-        # Compute cache age
-        from datetime import datetime, timezone
-
-        try:
-            cache_dt = datetime.fromisoformat(queried_at.replace('Z', '+00:00'))
-            if cache_dt.tzinfo is None:
-                cache_dt = cache_dt.replace(tzinfo=timezone.utc)
-            cache_age = max((datetime.now(timezone.utc) - cache_dt).total_seconds(), 0)
-        except Exception:
-            cache_age = 0.0
+        cache_age = _cache_age_seconds(queried_at, row[2])
 
         usage_data['_cache_source'] = 'cache'
         usage_data['_cache_age_seconds'] = cache_age
@@ -252,7 +252,7 @@ def force_refresh(identifier: Optional[str]):
             account_display = f'[{account.index_num}] {account.nickname or account.email}'
 
             try:
-                refreshed_creds = credential_store.refresh_access_token(account.credentials_json, force=True)
+                refreshed_creds, _ = credential_store.refresh_access_token(account.credentials_json, force=True)
 
                 # Update stored credentials
                 factory.get_store().update_credentials(account.uuid, refreshed_creds)
@@ -13,11 +13,13 @@ from rich.table import Table
 from ...constants import console
 from ...infrastructure.locking import acquire_lock
 from ...infrastructure.factory import ServiceFactory
+from ...utils import parse_iso_timestamp
+from ..renderers import truncate_cwd
 
 
 def _parse_sqlite_timestamp_to_local(timestamp_str: str) -> datetime:
     """Parse SQLite UTC timestamp to naive local datetime."""
-    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    dt = parse_iso_timestamp(timestamp_str)
     return dt.astimezone().replace(tzinfo=None)
 
 
@@ -126,9 +128,7 @@ def list_sessions(output_json: bool):
 
             session_id_short = session.session_id[:8] + '...'
 
-            cwd = session.cwd or 'unknown'
-            if len(cwd) > 40:
-                cwd = '...' + cwd[-37:]
+            cwd = truncate_cwd(session.cwd, 40)
 
             table.add_row(
                 session_id_short,
@@ -165,8 +165,8 @@ def session_history(limit: int, min_duration: int, output_json: bool):
             # Calculate duration from timestamps
             from datetime import datetime
 
-            created = datetime.fromisoformat(session.created_at.replace('Z', '+00:00'))
-            ended = datetime.fromisoformat(session.ended_at.replace('Z', '+00:00'))
+            created = parse_iso_timestamp(session.created_at)
+            ended = parse_iso_timestamp(session.ended_at)
             duration_seconds = (ended - created).total_seconds()
 
             sessions.append(
@@ -259,9 +259,7 @@ def session_history(limit: int, min_duration: int, output_json: bool):
                     index = acc.index_num
                     account_display = f'[{index}] {nickname or acc.email}'
 
-            cwd = session['cwd'] or 'unknown'
-            if len(cwd) > 45:
-                cwd = '...' + cwd[-42:]
+            cwd = truncate_cwd(session['cwd'], 45)
 
             duration_seconds = session['duration_seconds']
             if duration_seconds < 60:
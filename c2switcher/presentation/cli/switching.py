@@ -297,7 +297,7 @@ def cycle():
 
         # Switch to next account
         credential_store = factory.get_credential_store()
-        refreshed_creds = credential_store.refresh_access_token(next_account.credentials_json)
+        refreshed_creds, _ = credential_store.refresh_access_token(next_account.credentials_json)
         credential_store.write_credentials(refreshed_creds)
 
         console.print(
@@ -3,17 +3,51 @@
 from __future__ import annotations
 
 import json
+import sys
 from datetime import datetime
+from typing import Any, Dict, Iterable
 
 import click
-from rich import box
-from rich.table import Table
 
 from ...constants import console
-from ...infrastructure.locking import acquire_lock
+from ...core.models import UsageSnapshot
 from ...infrastructure.factory import ServiceFactory
-from ...infrastructure.api import ClaudeAPI
-from ...utils import format_time_until_reset, parse_sqlite_timestamp_to_local
+from ...utils import parse_sqlite_timestamp_to_local
+from ..renderers import render_usage_table, truncate_cwd, usage_table_row
+
+
+def _cached_usage_dict(cached: UsageSnapshot, source: str) -> Dict[str, Any]:
+    """Shape a cached UsageSnapshot like a live usage payload."""
+    return {
+        'five_hour': {'utilization': cached.five_hour.utilization},
+        'seven_day': {
+            'utilization': cached.seven_day.utilization,
+            'resets_at': cached.seven_day.resets_at,
+        },
+        'seven_day_opus': {
+            'utilization': cached.seven_day_opus.utilization,
+            'resets_at': cached.seven_day_opus.resets_at,
+        },
+        'seven_day_sonnet': {
+            'utilization': cached.seven_day_sonnet.utilization,
+            'resets_at': cached.seven_day_sonnet.resets_at,
+        },
+        '_cache_source': source,
+        '_cache_age_seconds': cached.cache_age_seconds,
+        '_queried_at': cached.queried_at,
+    }
+
+
+def _write_json_array(items: Iterable[Dict[str, Any]]):
+    """Write items to stdout as an indented JSON array, one element at a time."""
+    out = sys.stdout
+    first = True
+    for item in items:
+        out.write('[\n  ' if first else ',\n  ')
+        out.write(json.dumps(item, indent=2).replace('\n', '\n  '))
+        out.flush()
+        first = False
+    out.write('[]\n' if first else '\n]\n')
 
 
 def _get_account_usage(store, account_uuid: str, credentials_json: str, force: bool = False):
@@ -23,40 +57,15 @@ def _get_account_usage(store, account_uuid: str, credentials_json: str, force: b
     if not force:
         cached = store.get_recent_usage(account_uuid, max_age_seconds=300)
         if cached:
-            cache_age = None
-            try:
-                cache_dt = datetime.fromisoformat(cached.queried_at.replace('Z', '+00:00'))
-                cache_age = max((datetime.now(timezone.utc) - cache_dt).total_seconds(), 0)
-            except Exception:
-                cache_age = None
-
-            return {
-                'five_hour': {
-                    'utilization': cached.five_hour.utilization,
-                },
-                'seven_day': {
-                    'utilization': cached.seven_day.utilization,
-                    'resets_at': cached.seven_day.resets_at,
-                },
-                'seven_day_opus': {
-                    'utilization': cached.seven_day_opus.utilization,
-                    'resets_at': cached.seven_day_opus.resets_at,
-                },
-                'seven_day_sonnet': {
-                    'utilization': cached.seven_day_sonnet.utilization,
-                    'resets_at': cached.seven_day_sonnet.resets_at,
-                },
-                '_cache_source': 'cache',
-                '_cache_age_seconds': cache_age,
-                '_queried_at': cached.queried_at,
-            }
+            return _cached_usage_dict(cached, 'cache')
 
     # Fetch fresh usage
-    from ...data.credential_store import CredentialStore
     from ...constants import CREDENTIALS_PATH
+    from ...data.credential_store import CredentialStore
+    from ...infrastructure.api import ClaudeAPI
 
     cred_store = CredentialStore(CREDENTIALS_PATH)
-    refreshed_creds = cred_store.refresh_access_token(credentials_json)
+    refreshed_creds, refreshed = cred_store.refresh_access_token(credentials_json)
     token = refreshed_creds.get('claudeAiOauth', {}).get('accessToken')
 
     if not token:
@@ -65,41 +74,13 @@ def _get_account_usage(store, account_uuid: str, credentials_json: str, force: b
     usage = ClaudeAPI.get_usage(token)
 
     # Check if API returned all nulls (intermittent API bug)
-    has_data = any([
-        usage.get('five_hour'),
-        usage.get('seven_day'),
-        usage.get('seven_day_sonnet'),
-    ])
+    has_data = any(usage.get(key) for key in ('five_hour', 'seven_day', 'seven_day_sonnet'))
 
     if not has_data:
         # Fall back to cached data (up to 24h old)
         cached = store.get_recent_usage(account_uuid, max_age_seconds=86400, require_data=True)
         if cached:
-            cache_age = None
-            try:
-                cache_dt = datetime.fromisoformat(cached.queried_at.replace('Z', '+00:00'))
-                cache_age = max((datetime.now(timezone.utc) - cache_dt).total_seconds(), 0)
-            except Exception:
-                cache_age = None
-
-            return {
-                'five_hour': {'utilization': cached.five_hour.utilization},
-                'seven_day': {
-                    'utilization': cached.seven_day.utilization,
-                    'resets_at': cached.seven_day.resets_at,
-                },
-                'seven_day_opus': {
-                    'utilization': cached.seven_day_opus.utilization,
-                    'resets_at': cached.seven_day_opus.resets_at,
-                },
-                'seven_day_sonnet': {
-                    'utilization': cached.seven_day_sonnet.utilization,
-                    'resets_at': cached.seven_day_sonnet.resets_at,
-                },
-                '_cache_source': 'fallback',
-                '_cache_age_seconds': cache_age,
-                '_queried_at': cached.queried_at,
-            }
+            return _cached_usage_dict(cached, 'fallback')
 
     usage['_cache_source'] = 'live'
     usage['_cache_age_seconds'] = 0.0
@@ -108,18 +89,42 @@ def _get_account_usage(store, account_uuid: str, credentials_json: str, force: b
     # Save to DB (only if we have actual data)
     store.save_usage(account_uuid, usage)
 
-    # Update credentials if changed
-    if refreshed_creds != json.loads(credentials_json):
+    # Update credentials if refreshed
+    if refreshed:
         store.update_credentials(account_uuid, refreshed_creds)
 
     return usage
 
 
+def _fetch_usage_item(store, acc, session_counts: Dict[str, int], force: bool) -> Dict[str, Any]:
+    """Fetch usage for one account into a usage_data entry, capturing errors."""
+    try:
+        usage_info = _get_account_usage(store, acc.uuid, acc.credentials_json, force=force)
+    except Exception as exc:
+        console.print(f'[red]Error fetching usage for {acc.nickname or acc.email}: {exc}[/red]')
+        return {
+            'account': acc,
+            'usage': None,
+            'sessions': session_counts.get(acc.uuid, 0),
+            'error': str(exc),
+        }
+
+    return {
+        'account': acc,
+        'usage': usage_info,
+        'sessions': session_counts.get(acc.uuid, 0),
+    }
+
+
 @click.command()
 @click.option('--json', 'output_json', is_flag=True, help='Output as JSON')
 @click.option('--force', is_flag=True, help='Force refresh (ignore cache)')
 def usage(output_json: bool, force: bool):
     """List usage across all accounts with session distribution."""
+    from rich.live import Live
+
+    from ...infrastructure.locking import acquire_lock
+
     acquire_lock()
     factory = ServiceFactory()
 
@@ -137,38 +142,14 @@ def usage(output_json: bool, force: bool):
         store = factory.get_store()
         session_counts = store.get_active_session_counts()
 
-        usage_data = []
-        for acc in accounts:
-            try:
-                display_name = acc.nickname or acc.email
-                with console.status(f'[bold green]Fetching usage for {display_name}...'):
-                    usage_info = _get_account_usage(store, acc.uuid, acc.credentials_json, force=force)
-
-                usage_data.append(
-                    {
-                        'account': acc,
-                        'usage': usage_info,
-                        'sessions': session_counts.get(acc.uuid, 0),
-                    }
-                )
-            except Exception as exc:
-                display_name = acc.nickname or acc.email
-                console.print(f'[red]Error fetching usage for {display_name}: {exc}[/red]')
-                usage_data.append(
-                    {
-                        'account': acc,
-                        'usage': None,
-                        'sessions': session_counts.get(acc.uuid, 0),
-                        'error': str(exc),
-                    }
-                )
-
         if output_json:
-            result = []
-            for item in usage_data:
-                acc = item['account']
-                result.append(
-                    {
+
+            def json_items():
+                # Each account is written as soon as it resolves; status and errors go to the stderr console
+                for acc in accounts:
+                    with console.status(f'[bold green]Fetching usage for {acc.nickname or acc.email}...'):
+                        item = _fetch_usage_item(store, acc, session_counts, force)
+                    yield {
                         'index': acc.index_num,
                         'nickname': acc.nickname,
                         'email': acc.email,
@@ -176,74 +157,18 @@ def usage(output_json: bool, force: bool):
                         'sessions': item['sessions'],
                         'error': item.get('error'),
                     }
-                )
-            print(json.dumps(result, indent=2))
+
+            _write_json_array(json_items())
             return
 
-        table = Table(title='Usage Across Accounts', box=box.ROUNDED)
-        table.add_column('Index', style='cyan', justify='center')
-        table.add_column('Nickname', style='magenta')
-        table.add_column('Email', style='green')
-        table.add_column('5h', justify='right')
-        table.add_column('7d', justify='right')
-        table.add_column('7d Sonnet', justify='right')
-        table.add_column('Reset (Rate)', justify='right', no_wrap=True)
-        table.add_column('Sessions', style='blue', justify='center')
-
-        for item in usage_data:
-            acc = item['account']
-            usage_info = item['usage']
-            sessions = item['sessions']
-
-            session_str = f'[blue]{sessions}[/blue]' if sessions > 0 else '[dim]0[/dim]'
-
-            if usage_info is None:
-                table.add_row(
-                    str(acc.index_num),
-                    acc.nickname or '[dim]--[/dim]',
-                    acc.email,
-                    '[red]Error[/red]',
-                    '[red]Error[/red]',
-                    '[red]Error[/red]',
-                    '[red]Error[/red]',
-                    session_str,
-                )
-                continue
-
-            five_hour = usage_info.get('five_hour', {}) or {}
-            seven_day = usage_info.get('seven_day', {}) or {}
-            seven_day_sonnet = usage_info.get('seven_day_sonnet', {}) or {}
-
-            def format_usage(value):
-                if value is None:
-                    return '[dim]--[/dim]'
-                if value >= 90:
-                    return f'[red]{value}%[/red]'
-                if value >= 70:
-                    return f'[yellow]{value}%[/yellow]'
-                return f'[green]{value}%[/green]'
-
-            sonnet_util = seven_day_sonnet.get('utilization')
-            overall_util = seven_day.get('utilization')
-            reset_time = format_time_until_reset(
-                seven_day_sonnet.get('resets_at') if seven_day_sonnet else None,
-                seven_day.get('resets_at'),
-                sonnet_util if sonnet_util is not None else 0,
-                overall_util if overall_util is not None else 0,
-            )
-
-            table.add_row(
-                str(acc.index_num),
-                acc.nickname or '[dim]--[/dim]',
-                acc.email,
-                format_usage(five_hour.get('utilization')),
-                format_usage(seven_day.get('utilization')),
-                format_usage(seven_day_sonnet.get('utilization')),
-                reset_time,
-                session_str,
-            )
-
-        console.print(table)
+        # Render rows as soon as each account resolves instead of after the last fetch
+        table = render_usage_table([])
+        with Live(table, console=console, refresh_per_second=4) as live:
+            for acc in accounts:
+                table.caption = f'[bold green]Fetching usage for {acc.nickname or acc.email}...'
+                live.refresh()
+                table.add_row(*usage_table_row(_fetch_usage_item(store, acc, session_counts, force)))
+            table.caption = None
 
         # Show active sessions
         active_sessions = session_service.list_active()
@@ -266,9 +191,7 @@ def usage(output_json: bool, force: bool):
                 else:
                     time_str = f'{int(time_ago.total_seconds() / 3600)}h ago'
 
-                cwd = session.cwd or 'unknown'
-                if len(cwd) > 35:
-                    cwd = '...' + cwd[-32:]
+                cwd = truncate_cwd(session.cwd, 35)
 
                 console.print(f'  * {account_email} [dim]({cwd}, {time_str})[/dim]')
 
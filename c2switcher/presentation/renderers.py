@@ -3,13 +3,61 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from rich import box
 from rich.panel import Panel
 from rich.table import Table
 
 from ..core.models import Account, SelectionDecision, Session
+from ..utils import parse_iso_timestamp
+
+
+_ACCOUNT_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ('Index', {'style': 'cyan', 'justify': 'center'}),
+    ('Nickname', {'style': 'magenta'}),
+    ('Email', {'style': 'green'}),
+    ('Name', {'style': 'blue'}),
+    ('Type', {'justify': 'center'}),
+    ('Tier', {'style': 'yellow'}),
+)
+
+_SESSION_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ('Session ID', {'style': 'cyan'}),
+    ('Account', {'style': 'green'}),
+    ('PID', {'style': 'yellow'}),
+    ('Working Directory', {'style': 'blue'}),
+    ('Started', {'style': 'magenta'}),
+)
+
+_USAGE_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ('Index', {'style': 'cyan', 'justify': 'center'}),
+    ('Nickname', {'style': 'magenta'}),
+    ('Email', {'style': 'green'}),
+    ('5h', {'justify': 'right'}),
+    ('7d', {'justify': 'right'}),
+    ('7d Sonnet', {'justify': 'right'}),
+    ('Reset (Rate)', {'justify': 'right', 'no_wrap': True}),
+    ('Sessions', {'style': 'blue', 'justify': 'center'}),
+)
+
+_SESSION_HISTORY_COLUMNS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ('Account', {'style': 'cyan'}),
+    ('Project Path', {'style': 'blue'}),
+    ('Duration', {'style': 'magenta', 'justify': 'right'}),
+    ('Sonnet Δ', {'style': 'yellow', 'justify': 'right'}),
+    ('Overall Δ', {'style': 'yellow', 'justify': 'right'}),
+    ('Ended', {'style': 'dim', 'justify': 'right'}),
+)
+
+
+def _make_table(title: str, columns: Tuple[Tuple[str, Dict[str, Any]], ...]) -> Table:
+    """Build a rounded Rich table from a static column spec."""
+    table = Table(title=title, box=box.ROUNDED)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
 
 def format_usage_value(value: Optional[int]) -> str:
@@ -23,6 +71,16 @@ def format_usage_value(value: Optional[int]) -> str:
     return f'[green]{value}%[/green]'
 
 
+@lru_cache(maxsize=1024)
+def truncate_cwd(cwd: Optional[str], max_len: int = 40) -> str:
+    """Shorten a working directory to its last max_len characters: '...ects/foo'."""
+    if not cwd:
+        return 'unknown'
+    if len(cwd) <= max_len:
+        return cwd
+    return '...' + cwd[-(max_len - 3) :]
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable form: '5m', '2h 30m', '1d 3h'."""
     if seconds < 60:
@@ -59,13 +117,7 @@ def format_time_ago(dt: datetime) -> str:
 
 def render_accounts_table(accounts: List[Account]) -> Table:
     """Render accounts list as Rich table."""
-    table = Table(title='Claude Code Accounts', box=box.ROUNDED)
-    table.add_column('Index', style='cyan', justify='center')
-    table.add_column('Nickname', style='magenta')
-    table.add_column('Email', style='green')
-    table.add_column('Name', style='blue')
-    table.add_column('Type', justify='center')
-    table.add_column('Tier', style='yellow')
+    table = _make_table('Claude Code Accounts', _ACCOUNT_COLUMNS)
 
     for acc in accounts:
         account_type = 'Max' if acc.has_claude_max else 'Pro' if acc.has_claude_pro else 'Free'
@@ -87,12 +139,7 @@ def render_sessions_table(sessions: List[Session]) -> Table:
     """Render active sessions as Rich table."""
     from ..data.store import Store
 
-    table = Table(title='Active Claude Sessions', box=box.ROUNDED)
-    table.add_column('Session ID', style='cyan')
-    table.add_column('Account', style='green')
-    table.add_column('PID', style='yellow')
-    table.add_column('Working Directory', style='blue')
-    table.add_column('Started', style='magenta')
+    table = _make_table('Active Claude Sessions', _SESSION_COLUMNS)
 
     store = Store()
     try:
@@ -108,9 +155,7 @@ def render_sessions_table(sessions: List[Session]) -> Table:
 
             session_id_short = session.session_id[:8] + '...'
 
-            cwd = session.cwd or 'unknown'
-            if len(cwd) > 40:
-                cwd = '...' + cwd[-37:]
+            cwd = truncate_cwd(session.cwd, 40)
 
             table.add_row(
                 session_id_short,
@@ -125,64 +170,58 @@ def render_sessions_table(sessions: List[Session]) -> Table:
     return table
 
 
-def render_usage_table(usage_data: List[Dict[str, Any]]) -> Table:
-    """Render usage data across accounts as Rich table."""
+def usage_table_row(item: Dict[str, Any]) -> Tuple[str, ...]:
+    """Format one usage_data entry as a row for the usage table."""
     from ..utils import format_time_until_reset
 
-    table = Table(title='Usage Across Accounts', box=box.ROUNDED)
-    table.add_column('Index', style='cyan', justify='center')
-    table.add_column('Nickname', style='magenta')
-    table.add_column('Email', style='green')
-    table.add_column('5h', justify='right')
-    table.add_column('7d', justify='right')
-    table.add_column('7d Sonnet', justify='right')
-    table.add_column('Reset (Rate)', justify='right', no_wrap=True)
-    table.add_column('Sessions', style='blue', justify='center')
-
-    for item in usage_data:
-        acc = item['account']
-        usage_info = item.get('usage')
-        sessions = item.get('sessions', 0)
+    index_num, nickname, email = _account_identity(item['account'])
+    usage_info = item.get('usage')
+    sessions = item.get('sessions', 0)
+
+    session_str = f'[blue]{sessions}[/blue]' if sessions > 0 else '[dim]0[/dim]'
+
+    if usage_info is None:
+        return (
+            str(index_num),
+            nickname or '[dim]--[/dim]',
+            email,
+            '[red]Error[/red]',
+            '[red]Error[/red]',
+            '[red]Error[/red]',
+            '[red]Error[/red]',
+            session_str,
+        )
 
-        session_str = f'[blue]{sessions}[/blue]' if sessions > 0 else '[dim]0[/dim]'
+    five_hour = usage_info.get('five_hour', {}) or {}
+    seven_day = usage_info.get('seven_day', {}) or {}
+    seven_day_sonnet = usage_info.get('seven_day_sonnet', {}) or {}
+
+    sonnet_util = seven_day_sonnet.get('utilization')
+    overall_util = seven_day.get('utilization')
+    reset_time = format_time_until_reset(
+        seven_day_sonnet.get('resets_at'),
+        seven_day.get('resets_at'),
+        sonnet_util if sonnet_util is not None else 0,
+        overall_util if overall_util is not None else 0,
+    )
 
-        if usage_info is None:
-            table.add_row(
-                str(acc.index_num if hasattr(acc, 'index_num') else acc.get('index_num')),
-                (acc.nickname if hasattr(acc, 'nickname') else acc.get('nickname')) or '[dim]--[/dim]',
-                acc.email if hasattr(acc, 'email') else acc.get('email'),
-                '[red]Error[/red]',
-                '[red]Error[/red]',
-                '[red]Error[/red]',
-                '[red]Error[/red]',
-                session_str,
-            )
-            continue
-
-        five_hour = usage_info.get('five_hour', {}) or {}
-        seven_day = usage_info.get('seven_day', {}) or {}
-        seven_day_sonnet = usage_info.get('seven_day_sonnet', {}) or {}
-
-        sonnet_util = seven_day_sonnet.get('utilization')
-        overall_util = seven_day.get('utilization')
-        reset_time = format_time_until_reset(
-            seven_day_sonnet.get('resets_at') if seven_day_sonnet else None,
-            seven_day.get('resets_at'),
-            sonnet_util if sonnet_util is not None else 0,
-            overall_util if overall_util is not None else 0,
-        )
+    return (
+        str(index_num),
+        nickname or '[dim]--[/dim]',
+        email,
+        format_usage_value(five_hour.get('utilization')),
+        format_usage_value(seven_day.get('utilization')),
+        format_usage_value(seven_day_sonnet.get('utilization')),
+        reset_time,
+        session_str,
+    )
 
-        table.add_row(
-            str(acc.index_num if hasattr(acc, 'index_num') else acc.get('index_num')),
-            (acc.nickname if hasattr(acc, 'nickname') else acc.get('nickname')) or '[dim]--[/dim]',
-            acc.email if hasattr(acc, 'email') else acc.get('email'),
-            format_usage_value(five_hour.get('utilization')),
-            format_usage_value(seven_day.get('utilization')),
-            format_usage_value(seven_day_sonnet.get('utilization')),
-            reset_time,
-            session_str,
-        )
 
+def render_usage_table(usage_data: List[Dict[str, Any]]) -> Table:
+    """Render usage data across accounts as Rich table."""
+    table = _make_table('Usage Across Accounts', _USAGE_COLUMNS)
+    for item in usage_data:
+        table.add_row(*usage_table_row(item))
     return table
 
 
@@ -190,13 +229,7 @@ def render_session_history_table(sessions: List[Dict[str, Any]]) -> Table:
     """Render session history with usage deltas as Rich table."""
     from ..data.store import Store
 
-    table = Table(title='Session History', box=box.ROUNDED)
-    table.add_column('Account', style='cyan')
-    table.add_column('Project Path', style='blue')
-    table.add_column('Duration', style='magenta', justify='right')
-    table.add_column('Sonnet Δ', style='yellow', justify='right')
-    table.add_column('Overall Δ', style='yellow', justify='right')
-    table.add_column('Ended', style='dim', justify='right')
+    table = _make_table('Session History', _SESSION_HISTORY_COLUMNS)
 
     store = Store()
     try:
@@ -211,9 +244,7 @@ def render_session_history_table(sessions: List[Dict[str, Any]]) -> Table:
                     index = acc.index_num
                     account_display = f'[{index}] {nickname or acc.email}'
 
-            cwd = session.get('cwd') or 'unknown'
-            if len(cwd) > 45:
-                cwd = '...' + cwd[-42:]
+            cwd = truncate_cwd(session.get('cwd'), 45)
 
             duration_seconds = session.get('duration_seconds', 0)
             duration_str = format_duration(duration_seconds)
@@ -324,12 +355,19 @@ def render_selection_panel(decision: SelectionDecision, verbose: bool = False) -
     return Panel(info_text, border_style='green')
 
 
+def _account_identity(account: Union[Account, Dict[str, Any]]) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    """Return (index_num, nickname, email) from an Account or a legacy account dict."""
+    if isinstance(account, Account):
+        return account.index_num, account.nickname, account.email
+    return account.get('index_num'), account.get('nickname'), account.get('email')
+
+
 def _parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
     """Parse ISO timestamp to datetime, handling None and errors gracefully."""
     if not timestamp:
         return None
     try:
-        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        dt = parse_iso_timestamp(timestamp)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.astimezone().replace(tzinfo=None)
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import io
+import math
+import os
 import sqlite3
+import time
 import webbrowser
-from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 from rich import box
 from rich.columns import Columns
 from rich.console import Console
@@ -21,125 +26,162 @@ from rich.panel import Panel
 from rich.table import Table
 
 console = Console()
-_WORKTREE_REPO_CACHE: Dict[Tuple[Path, str], str] = {}
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+_WORKTREE_REPO_CACHE: Dict[Tuple[str, str], str] = {}
+_READ_CONNECTIONS: Dict[Path, sqlite3.Connection] = {}
+
+
+def _read_connection(db_path: Path) -> sqlite3.Connection:
+    """Return a cached read-only connection so repeated reports reuse its page cache."""
+    conn = _READ_CONNECTIONS.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True, check_same_thread=False)
+        conn.execute('PRAGMA query_only=1')
+        conn.execute('PRAGMA mmap_size=1073741824')
+        conn.execute('PRAGMA cache_size=-131072')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        _READ_CONNECTIONS[db_path] = conn
+    return conn
+
+
+@lru_cache(maxsize=64)
+def _dirs_in(base_dir: str) -> FrozenSet[str]:
+    """List a directory's subdirectories once so candidate checks need no stat calls."""
+    try:
+        with os.scandir(base_dir) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return frozenset()
+
+
+def _resolve_worktree_repo(base_dir: str, worktree_name: str) -> str:
+    # Try the longest hyphen-delimited prefix first
+    subdirs = _dirs_in(base_dir)
+    end = len(worktree_name)
+    while end > 0:
+        candidate = worktree_name[:end]
+        if candidate in subdirs:
+            return candidate
+        end = worktree_name.rfind('-', 0, end)
+    return worktree_name.split('-', 1)[0]
 
 
-def _resolve_worktree_repo(base_dir: Path, worktree_name: str) -> str:
-    segments = worktree_name.split('-')
-    for length in range(len(segments), 0, -1):
-        candidate = '-'.join(segments[:length])
-        if (base_dir / candidate).is_dir():
-            return candidate
-    return segments[0] if segments else worktree_name
+def _worktree_repo(base_dir: str, worktree_name: str) -> str:
+    key = (base_dir or '/', worktree_name)
+    repo_name = _WORKTREE_REPO_CACHE.get(key)
+    if repo_name is None:
+        repo_name = _resolve_worktree_repo(*key)
+        _WORKTREE_REPO_CACHE[key] = repo_name
+    return repo_name or worktree_name
 
 
 def extract_project(path: Optional[str]) -> str:
     if not path:
         return 'unknown'
 
-    p = Path(path)
-    parts = p.parts
-
     # Collapse git worktree folders back to repo names
-    try:
-        wt_idx = parts.index('.worktrees')
-    except ValueError:
-        pass
-    else:
-        worktree_name = parts[wt_idx + 1] if len(parts) > wt_idx + 1 else ''
-        base_dir = Path(*parts[:wt_idx]) if wt_idx > 0 else Path('/')
+    wt_idx = path.find('/.worktrees/')
+    if wt_idx != -1:
+        worktree_name = path[wt_idx + len('/.worktrees/') :].split('/', 1)[0]
         if worktree_name:
-            key = (base_dir, worktree_name)
-            repo_name = _WORKTREE_REPO_CACHE.get(key)
-            if repo_name is None:
-                repo_name = _resolve_worktree_repo(base_dir, worktree_name)
-                _WORKTREE_REPO_CACHE[key] = repo_name
-            return repo_name or worktree_name
-
-    if 'Projects' in parts:
-        idx = parts.index('Projects')
-        if idx + 1 < len(parts):
-            return parts[idx + 1]
-
-    last = p.name
-    return last if last else 'unknown'
-
+            return _worktree_repo(path[:wt_idx], worktree_name)
 
-def load_sessions(db_path: Path, min_duration_sec: int, days: int) -> pd.DataFrame:
-    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
-    query = """
-        SELECT
-            s.session_id,
-            s.account_uuid,
-            s.cwd,
-            s.created_at,
-            s.ended_at,
-            a.nickname,
-            a.display_name,
-            a.email
-        FROM sessions s
-        LEFT JOIN accounts a ON s.account_uuid = a.uuid
-        WHERE s.ended_at IS NOT NULL
-        ORDER BY s.created_at DESC;
-    """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    if '/Projects/' in path:
+        project = path.split('/Projects/', 1)[1].split('/', 1)[0]
+        if project:
+            return project
 
-    if df.empty:
-        return df
+    last = path.rstrip('/').rsplit('/', 1)[-1]
+    return last if last else 'unknown'
 
-    # Convert UTC timestamps to local timezone for accurate hour/weekday analysis
-    local_tz = datetime.now().astimezone().tzinfo
-    created_at = pd.to_datetime(df['created_at'], utc=True).dt.tz_convert(local_tz).dt.tz_localize(None)
-    ended_at = pd.to_datetime(df['ended_at'], utc=True).dt.tz_convert(local_tz).dt.tz_localize(None)
 
-    df = df.assign(
-        created_at=created_at,
-        ended_at=ended_at,
-        duration_min=(ended_at - created_at).dt.total_seconds() / 60,
-    )
+def extract_projects(cwd: pd.Series) -> pd.Series:
+    """extract_project over a column of working directories, parsing each distinct cwd once."""
+    cwd_codes, unique_cwds = pd.factorize(cwd)
+    # Missing cwds factorize to -1, which picks the trailing 'unknown'
+    names = np.array([extract_project(path) for path in unique_cwds] + ['unknown'], dtype=object)
+    project_codes, categories = pd.factorize(names)
+    return pd.Series(pd.Categorical.from_codes(project_codes[cwd_codes], categories), index=cwd.index)
 
-    df = df[df['duration_min'] >= min_duration_sec / 60]
 
+def load_sessions(db_path: Path, min_duration_sec: int, days: int) -> pd.DataFrame:
+    # Duration and both filters are evaluated in SQL, using epoch seconds for an exact duration comparison
+    params: List[object] = []
+    recent_filter = ''
     if days > 0:
-        cutoff = datetime.now() - timedelta(days=days)
-        df = df[df['created_at'] >= cutoff]
-
-    df = df.assign(
-        project=df['cwd'].apply(extract_project),
-        account=df['nickname'].fillna(df['display_name']).fillna('unknown'),
-        date=df['created_at'].dt.date,
-        hour=df['created_at'].dt.hour,
-        weekday=df['created_at'].dt.day_name(),
+        recent_filter = 'AND created_at >= ?'
+        params.append(time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(math.ceil(time.time() - days * 86400))))
+    params.append(min_duration_sec)
+    query = f"""
+        WITH ended AS (
+            SELECT
+                session_id,
+                account_uuid,
+                cwd,
+                CAST(strftime('%s', created_at) AS INTEGER) AS created_epoch,
+                CAST(strftime('%s', ended_at) AS INTEGER) - CAST(strftime('%s', created_at) AS INTEGER) AS duration_sec
+            FROM sessions
+            WHERE ended_at IS NOT NULL {recent_filter}
+        )
+        SELECT
+            e.session_id,
+            e.cwd,
+            e.created_epoch AS created_at,
+            e.duration_sec,
+            COALESCE(a.nickname, a.display_name, 'unknown') AS account
+        FROM ended e
+        LEFT JOIN accounts a ON e.account_uuid = a.uuid
+        WHERE e.duration_sec >= ?;
+    """
+    rows = _read_connection(db_path).execute(query, params).fetchall()
+    if not rows:
+        return pd.DataFrame(columns=['session_id', 'created_at', 'duration_sec', 'project', 'account'])
+
+    # Transpose the rows into columns and type each one directly
+    session_ids, cwds, created_epochs, durations, accounts = zip(*rows)
+
+    # Shift UTC epoch seconds to local wall-clock seconds for hour/weekday analysis
+    offset_sec = int(datetime.now().astimezone().utcoffset().total_seconds())
+    local_sec = np.array(created_epochs, dtype=np.int64) + offset_sec
+    # Reinterpret nanoseconds as naive datetimes
+    created_at = pd.DatetimeIndex((local_sec * 1_000_000_000).view('datetime64[ns]'))
+
+    # Keep only what the report reads; weekday is an ordered Monday-first categorical
+    return pd.DataFrame(
+        {
+            'session_id': np.array(session_ids, dtype=object),
+            'created_at': created_at,
+            'duration_sec': np.array(durations, dtype=np.int32),
+            'project': extract_projects(pd.Series(cwds, dtype=object)),
+            'account': pd.Categorical(accounts),
+            'date': created_at.values.astype('datetime64[D]'),
+            'hour': (local_sec // 3600 % 24).astype(np.int8),
+            'weekday': pd.Categorical.from_codes((local_sec // 86400 + 3) % 7, categories=WEEKDAYS, ordered=True),
+        }
     )
 
-    return df
+
+# (seconds per unit, first value that rolls over to the next unit, suffix)
+_RELATIVE_UNITS = (
+    (1, 60, 's'),
+    (60, 60, 'm'),
+    (3600, 24, 'h'),
+    (86400, 14, 'd'),
+    (604800, 8, 'w'),
+    (2592000, 18, 'mo'),
+)
 
 
-def format_relative_time(moment: Optional[datetime]) -> str:
+def format_relative_time(moment: Optional[datetime], now: Optional[datetime] = None) -> str:
     if moment is None:
         return '—'
-    delta = datetime.now() - moment
+    delta = (now or datetime.now()) - moment
     seconds = max(0, int(delta.total_seconds()))
-    if seconds < 60:
-        return f'{seconds}s ago'
-    minutes = seconds // 60
-    if minutes < 60:
-        return f'{minutes}m ago'
-    hours = minutes // 60
-    if hours < 24:
-        return f'{hours}h ago'
-    days = hours // 24
-    if days < 14:
-        return f'{days}d ago'
-    weeks = days // 7
-    if weeks < 8:
-        return f'{weeks}w ago'
-    months = days // 30
-    if months < 18:
-        return f'{months}mo ago'
-    years = days // 365
-    return f'{years}y ago'
+    for unit, limit, suffix in _RELATIVE_UNITS:
+        value = seconds // unit
+        if value < limit:
+            return f'{value}{suffix} ago'
+    return f'{seconds // 31536000}y ago'
 
 
 @dataclass
@@ -165,31 +207,36 @@ class SessionMetrics:
 
 
 def compute_session_metrics(df: pd.DataFrame) -> SessionMetrics:
-    total_minutes = float(df['duration_min'].sum())
+    total_minutes = int(df['duration_sec'].sum()) / 60
     total_hours = total_minutes / 60
     total_sessions = len(df)
-    unique_projects = df['project'].nunique()
+    # Projects are categorical: counting occupied codes is one integer pass with no hashing
+    unique_projects = int(np.count_nonzero(np.bincount(df['project'].cat.codes.to_numpy(np.intp))))
     unique_accounts = df['account'].nunique()
     first_session = df['created_at'].min()
     last_session = df['created_at'].max()
     span_days = max(1, (last_session.date() - first_session.date()).days + 1)
     avg_daily_hours = total_hours / span_days if span_days else 0.0
-    median_session = float(df['duration_min'].median()) if total_sessions else 0.0
-    longest_idx = df['duration_min'].idxmax()
+    median_session = float(df['duration_sec'].median()) / 60 if total_sessions else 0.0
+    longest_idx = df['duration_sec'].idxmax()
     longest_row = df.loc[longest_idx]
     longest_project = longest_row['project']
     longest_account = longest_row['account']
-    longest_minutes = float(longest_row['duration_min'])
+    longest_minutes = longest_row['duration_sec'] / 60
 
     recent_window = last_session - timedelta(days=7)
     recent_df = df[df['created_at'] >= recent_window]
-    recent_hours = recent_df['duration_min'].sum() / 60 if not recent_df.empty else 0.0
+    recent_hours = recent_df['duration_sec'].sum() / 3600 if not recent_df.empty else 0.0
     recent_sessions = int(recent_df['session_id'].nunique()) if not recent_df.empty else 0
-    recent_projects = Counter(recent_df['project']).most_common(3) if not recent_df.empty else []
+    recent_counts = recent_df['project'].value_counts()
+    recent_projects = [(name, int(count)) for name, count in recent_counts[recent_counts > 0].head(3).items()]
 
-    busiest_hour = int(df.groupby('hour')['duration_min'].sum().idxmax()) if total_sessions else None
-    day_totals = df.groupby('weekday')['duration_min'].sum().sort_values(ascending=False)
-    busiest_day = day_totals.index[0] if not day_totals.empty else None
+    # Hours and weekdays are small dense codes, so weighted bincounts replace hashed groupbys
+    durations = df['duration_sec'].to_numpy()
+    hour_totals = np.bincount(df['hour'].to_numpy(np.intp), weights=durations, minlength=24)
+    day_totals = np.bincount(df['weekday'].cat.codes.to_numpy(np.intp), weights=durations, minlength=7)
+    busiest_hour = int(hour_totals.argmax()) if total_sessions else None
+    busiest_day = WEEKDAYS[int(day_totals.argmax())] if total_sessions else None
 
     return SessionMetrics(
         total_sessions=total_sessions,
@@ -213,15 +260,99 @@ def compute_session_metrics(df: pd.DataFrame) -> SessionMetrics:
     )
 
 
-def activity_snapshot_panel(metrics: SessionMetrics) -> Panel:
+@dataclass
+class ReportContext:
+    df: pd.DataFrame
+    now: datetime
+    metrics: SessionMetrics
+    projects: pd.DataFrame
+    hour_seconds: pd.Series
+    hour_sessions: pd.Series
+    hour_signature: pd.Series
+    accounts: pd.DataFrame
+    daily_hours: pd.Series
+    weekday_hour: np.ndarray
+    duration_bins: np.ndarray
+    duration_counts: np.ndarray
+
+
+def build_report_context(df: pd.DataFrame, now: datetime) -> ReportContext:
+    """Run every aggregation the report sections share in a single place."""
+    projects = (
+        df.groupby('project', observed=True)
+        .agg(
+            seconds=('duration_sec', 'sum'),
+            sessions=('session_id', 'count'),
+            median_sec=('duration_sec', 'median'),
+            last_seen=('created_at', 'max'),
+            accounts=('account', 'nunique'),
+        )
+        .sort_values('seconds', ascending=False)
+    )
+    # Derived columns from the sums and counts above
+    total_seconds = projects['seconds'].sum()
+    projects['avg_sec'] = projects['seconds'] / projects['sessions']
+    projects['hours'] = projects['seconds'] / 3600
+    projects['share'] = projects['seconds'] / total_seconds if total_seconds else 0.0
+    accounts = (
+        df.groupby('account', observed=True)
+        .agg(
+            seconds=('duration_sec', 'sum'),
+            sessions=('session_id', 'count'),
+            unique_projects=('project', 'nunique'),
+        )
+        .sort_values('seconds', ascending=False)
+    )
+    account_projects = df.groupby(['account', 'project'], observed=True)['duration_sec'].sum()
+    accounts['hours'] = accounts['seconds'] / 3600
+    accounts['share'] = accounts['seconds'] / total_seconds if total_seconds else 0.0
+    accounts['focus_project'] = account_projects.groupby(level=0, observed=True).idxmax().map(lambda key: key[1])
+
+    # Per-hour totals and counts are bincounts over the 0-23 hour codes
+    hours = df['hour'].to_numpy(np.intp)
+    durations = df['duration_sec'].to_numpy()
+    hour_projects = df.groupby(['hour', 'project'], observed=True)['duration_sec'].sum()
+
+    # Monday-first 7x24 grid from one weighted bincount over flat (weekday, hour) cells
+    cells = df['weekday'].cat.codes.to_numpy(np.intp) * 24 + hours
+    grid_seconds = np.bincount(cells, weights=durations, minlength=7 * 24).reshape(7, 24)
+
+    # Session-length histogram: 29 bins up to the longest session (capped at 4h)
+    metrics = compute_session_metrics(df)
+    duration_bins = np.linspace(0, min(240, metrics.longest_minutes + 10), 30)
+    # Same binning as np.histogram, including its closed top edge
+    duration_min = durations / 60
+    duration_min = duration_min[duration_min <= duration_bins[-1]]
+    bin_index = np.minimum(np.searchsorted(duration_bins, duration_min, side='right') - 1, 28)
+    duration_counts = np.bincount(bin_index, minlength=29)
+
+    return ReportContext(
+        df=df,
+        now=now,
+        metrics=metrics,
+        projects=projects,
+        hour_seconds=pd.Series(grid_seconds.sum(axis=0)),
+        hour_sessions=pd.Series(np.bincount(hours, minlength=24)),
+        hour_signature=hour_projects.groupby(level=0, observed=True).idxmax().map(lambda key: key[1]),
+        accounts=accounts,
+        daily_hours=df.groupby('date', observed=True)['duration_sec'].sum() / 3600,
+        weekday_hour=grid_seconds / 60,
+        duration_bins=duration_bins,
+        duration_counts=duration_counts,
+    )
+
+
+def activity_snapshot_panel(ctx: ReportContext) -> Panel:
+    metrics = ctx.metrics
+    now = ctx.now
     lines = [
         f'[bold]{metrics.total_sessions}[/] sessions across {metrics.span_days} day(s)',
         f'Focus time: [bold]{metrics.total_hours:.1f}h[/] ({metrics.avg_daily_hours:.1f}h/day)',
         f'Projects: {metrics.unique_projects} • Accounts: {metrics.unique_accounts}',
         f'Median session: {metrics.median_session_min:.0f}m • Longest: {metrics.longest_minutes:.0f}m '
         f'({metrics.longest_project}, {metrics.longest_account})',
-        f'First session: {metrics.first_session:%Y-%m-%d} ({format_relative_time(metrics.first_session)})',
-        f'Latest session: {metrics.last_session:%Y-%m-%d %H:%M} ({format_relative_time(metrics.last_session)})',
+        f'First session: {metrics.first_session:%Y-%m-%d} ({format_relative_time(metrics.first_session, now)})',
+        f'Latest session: {metrics.last_session:%Y-%m-%d %H:%M} ({format_relative_time(metrics.last_session, now)})',
     ]
     if metrics.busiest_hour is not None:
         lines.append(f'Peak hour: {metrics.busiest_hour:02d}:00')
@@ -235,20 +366,8 @@ def activity_snapshot_panel(metrics: SessionMetrics) -> Panel:
     )
 
 
-def project_cards(df: pd.DataFrame, limit: int = 6) -> Columns | Panel:
-    project_stats = (
-        df.groupby('project')
-        .agg(
-            minutes=('duration_min', 'sum'),
-            sessions=('session_id', 'count'),
-            median_min=('duration_min', 'median'),
-            avg_min=('duration_min', 'mean'),
-            last_seen=('created_at', 'max'),
-            accounts=('account', 'nunique'),
-        )
-        .sort_values('minutes', ascending=False)
-    )
-
+def project_cards(ctx: ReportContext, limit: int = 6) -> Columns | Panel:
+    project_stats = ctx.projects
     if project_stats.empty:
         return Panel(
             'No project activity recorded.',
@@ -257,10 +376,18 @@ def project_cards(df: pd.DataFrame, limit: int = 6) -> Columns | Panel:
             box=box.ROUNDED,
         )
 
-    total_minutes = project_stats['minutes'].sum()
     cards = []
-    for project, row in project_stats.head(limit).iterrows():
-        share = row['minutes'] / total_minutes if total_minutes else 0
+    top = project_stats.head(limit)
+    for project, hours, share, sessions, accounts, median_sec, avg_sec, last_seen in zip(
+        top.index,
+        top['hours'].to_numpy(),
+        top['share'].to_numpy(),
+        top['sessions'].to_numpy(),
+        top['accounts'].to_numpy(),
+        top['median_sec'].to_numpy(),
+        top['avg_sec'].to_numpy(),
+        top['last_seen'],
+    ):
         if share >= 0.35:
             border = 'magenta'
         elif share >= 0.18:
@@ -269,10 +396,10 @@ def project_cards(df: pd.DataFrame, limit: int = 6) -> Columns | Panel:
             border = 'cyan'
         lines = [
             f'[bold]{project}[/]',
-            f'{row["minutes"] / 60:.1f}h total ({share * 100:.0f}%)',
-            f'{int(row["sessions"])} session(s) • {int(row["accounts"])} account(s)',
-            f'Median {row["median_min"]:.0f}m • Avg {row["avg_min"]:.0f}m',
-            f'Last active {format_relative_time(row["last_seen"])}',
+            f'{hours:.1f}h total ({share * 100:.0f}%)',
+            f'{int(sessions)} session(s) • {int(accounts)} account(s)',
+            f'Median {median_sec / 60:.0f}m • Avg {avg_sec / 60:.0f}m',
+            f'Last active {format_relative_time(last_seen, ctx.now)}',
         ]
         cards.append(Panel('\n'.join(lines), border_style=border, box=box.ROUNDED, padding=(0, 1)))
 
@@ -280,20 +407,8 @@ def project_cards(df: pd.DataFrame, limit: int = 6) -> Columns | Panel:
     return Panel(columns, title='Project Highlights', border_style='magenta', box=box.ROUNDED)
 
 
-def project_detail_table(df: pd.DataFrame) -> Table:
-    totals = df['duration_min'].sum()
-    project_stats = (
-        df.groupby('project')
-        .agg(
-            minutes=('duration_min', 'sum'),
-            sessions=('session_id', 'count'),
-            median_min=('duration_min', 'median'),
-            avg_min=('duration_min', 'mean'),
-            accounts=('account', 'nunique'),
-        )
-        .sort_values('minutes', ascending=False)
-        .head(10)
-    )
+def project_detail_table(ctx: ReportContext) -> Table:
+    project_stats = ctx.projects.head(10)
 
     table = Table(
         title='Top Focus Areas',
@@ -309,24 +424,31 @@ def project_detail_table(df: pd.DataFrame) -> Table:
     table.add_column('Avg', justify='right')
     table.add_column('Accounts', justify='right')
 
-    for project, row in project_stats.iterrows():
-        share = (row['minutes'] / totals * 100) if totals else 0
+    # Columnar iteration: no per-row Series boxing
+    for project, hours, share, sessions, median_sec, avg_sec, accounts in zip(
+        project_stats.index,
+        project_stats['hours'].to_numpy(),
+        project_stats['share'].to_numpy(),
+        project_stats['sessions'].to_numpy(),
+        project_stats['median_sec'].to_numpy(),
+        project_stats['avg_sec'].to_numpy(),
+        project_stats['accounts'].to_numpy(),
+    ):
         table.add_row(
             project,
-            f'{row["minutes"] / 60:.1f}',
-            f'{share:4.1f}%',
-            f'{int(row["sessions"])}',
-            f'{row["median_min"]:.0f}m',
-            f'{row["avg_min"]:.0f}m',
-            f'{int(row["accounts"])}',
+            f'{hours:.1f}',
+            f'{share * 100:4.1f}%',
+            f'{int(sessions)}',
+            f'{median_sec / 60:.0f}m',
+            f'{avg_sec / 60:.0f}m',
+            f'{int(accounts)}',
         )
     return table
 
 
-def focus_windows_table(df: pd.DataFrame) -> Table:
-    totals = df['duration_min'].sum()
-    hour_stats = df.groupby('hour')['duration_min'].sum().reindex(range(24), fill_value=0).sort_values(ascending=False)
-    top_hours = hour_stats.head(6)
+def focus_windows_table(ctx: ReportContext) -> Table:
+    totals = ctx.projects['seconds'].sum()
+    top_hours = ctx.hour_seconds.sort_values(ascending=False).head(6)
 
     table = Table(
         title='Peak Focus Windows',
@@ -339,32 +461,20 @@ def focus_windows_table(df: pd.DataFrame) -> Table:
     table.add_column('Sessions', justify='right')
     table.add_column('Signature Project', justify='left')
 
-    for hour, minutes in top_hours.items():
-        share = (minutes / totals * 100) if totals else 0
-        sessions = int((df['hour'] == hour).sum())
-        project = df[df['hour'] == hour].groupby('project')['duration_min'].sum().sort_values(ascending=False).head(1)
-        project_name = project.index[0] if not project.empty else '—'
+    for hour, seconds in top_hours.items():
+        share = (seconds / totals * 100) if totals else 0
         table.add_row(
             f'{hour:02d}:00',
-            f'{minutes / 60:.1f}h',
+            f'{seconds / 3600:.1f}h',
             f'{share:4.1f}%',
-            str(sessions),
-            project_name,
+            str(ctx.hour_sessions[hour]),
+            ctx.hour_signature.get(hour, '—'),
         )
     return table
 
 
-def account_mix_table(df: pd.DataFrame) -> Table:
-    totals = df['duration_min'].sum()
-    account_stats = (
-        df.groupby('account')
-        .agg(
-            minutes=('duration_min', 'sum'),
-            sessions=('session_id', 'count'),
-            unique_projects=('project', 'nunique'),
-        )
-        .sort_values('minutes', ascending=False)
-    )
+def account_mix_table(ctx: ReportContext) -> Table:
+    account_stats = ctx.accounts
 
     table = Table(
         title='Account Distribution',
@@ -378,24 +488,27 @@ def account_mix_table(df: pd.DataFrame) -> Table:
     table.add_column('Projects', justify='right')
     table.add_column('Focus Anchor', justify='left')
 
-    for account, row in account_stats.iterrows():
-        minutes = row['minutes']
-        share = (minutes / totals * 100) if totals else 0
-        account_df = df[df['account'] == account]
-        focus_project = account_df.groupby('project')['duration_min'].sum().sort_values(ascending=False).head(1)
-        focus_name = focus_project.index[0] if not focus_project.empty else '—'
+    for account, hours, share, sessions, unique_projects, focus_project in zip(
+        account_stats.index,
+        account_stats['hours'].to_numpy(),
+        account_stats['share'].to_numpy(),
+        account_stats['sessions'].to_numpy(),
+        account_stats['unique_projects'].to_numpy(),
+        account_stats['focus_project'],
+    ):
         table.add_row(
             account,
-            f'{minutes / 60:.1f}',
-            f'{share:4.1f}%',
-            f'{int(row["sessions"])}',
-            f'{int(row["unique_projects"])}',
-            focus_name,
+            f'{hours:.1f}',
+            f'{share * 100:4.1f}%',
+            f'{int(sessions)}',
+            f'{int(unique_projects)}',
+            focus_project,
         )
     return table
 
 
-def momentum_panel(df: pd.DataFrame, metrics: SessionMetrics) -> Panel:
+def momentum_panel(ctx: ReportContext) -> Panel:
+    metrics = ctx.metrics
     if metrics.recent_sessions == 0:
         body = 'No sessions recorded in the last 7 days.'
     else:
@@ -409,12 +522,17 @@ def momentum_panel(df: pd.DataFrame, metrics: SessionMetrics) -> Panel:
     return Panel(body, title='Recent Momentum', border_style='magenta', box=box.ROUNDED)
 
 
-def recommendations_panel(df: pd.DataFrame, metrics: SessionMetrics) -> Panel:
+def recommendations_panel(ctx: ReportContext) -> Panel:
+    metrics = ctx.metrics
     lines: List[str] = []
-    latest_sessions = df.sort_values('created_at', ascending=False).head(5)
+    latest_sessions = ctx.df.nlargest(5, 'created_at')
     if not latest_sessions.empty:
-        recent_projects = Counter(latest_sessions['project'])
-        fav, count = recent_projects.most_common(1)[0]
+        project = latest_sessions['project']
+        codes = project.cat.codes.to_numpy(np.intp)
+        counts = np.bincount(codes)
+        count = int(counts.max())
+        # Ties go to the most recently touched project
+        fav = project.cat.categories[next(code for code in codes if counts[code] == count)]
         lines.append(
             f'Keep momentum on [bold]{fav}[/] — {count} of your last {len(latest_sessions)} sessions touched it.'
         )
@@ -431,12 +549,7 @@ def recommendations_panel(df: pd.DataFrame, metrics: SessionMetrics) -> Panel:
     if metrics.longest_minutes > 180:
         lines.append('Frequent >3h sessions. Block recovery time afterwards to avoid burnout.')
 
-    project_totals = df.groupby('project')['duration_min'].sum().sort_values(ascending=False)
-    total_minutes = project_totals.sum()
-    if total_minutes > 0:
-        project_share = project_totals / total_minutes
-    else:
-        project_share = pd.Series(dtype=float)
+    project_share = ctx.projects['share']
     if not project_share.empty and project_share.iloc[0] >= 0.6:
         lines.append(
             f'[bold]{project_share.index[0]}[/] accounts for {project_share.iloc[0] * 100:.0f}% of focus time — '
@@ -450,120 +563,142 @@ def recommendations_panel(df: pd.DataFrame, metrics: SessionMetrics) -> Panel:
     return Panel(body, title='Playbook', border_style='yellow', box=box.ROUNDED)
 
 
-def create_visualizations(df: pd.DataFrame, output_path: Path, days: int, show: bool) -> None:
-    plt.style.use('seaborn-v0_8')
-
-    fig = plt.figure(figsize=(18, 12))
-    fig.suptitle('C2Switcher Session Insights', fontsize=18, fontweight='bold')
-    gs = fig.add_gridspec(2, 2, height_ratios=[1, 1.1], wspace=0.25, hspace=0.3)
-
-    # Panel 1: Daily hours trend
-    ax1 = fig.add_subplot(gs[0, 0])
-    daily = df.groupby('date')['duration_min'].sum() / 60
-    if days > 0:
-        daily = daily.tail(days)
-    rolling = daily.rolling(window=7, min_periods=1).mean()
-    ax1.plot(
-        daily.index,
-        daily.values,
-        marker='o',
-        linewidth=2,
-        label='Daily hours',
-        color='#2b8a3e',
-    )
-    ax1.plot(
-        rolling.index,
-        rolling.values,
-        linestyle='--',
-        linewidth=2,
-        label='7-day avg',
-        color='#1971c2',
-    )
-    ax1.fill_between(daily.index, daily.values, color='#2b8a3e', alpha=0.2)
-    ax1.set_xlabel('Date')
-    ax1.set_ylabel('Hours')
-    ax1.set_title('Daily Focus Time')
-    ax1.grid(alpha=0.3)
-    ax1.legend(frameon=False)
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-    plt.setp(ax1.get_xticklabels(), rotation=45, ha='right')
-
-    # Panel 2: Top projects bar
-    ax2 = fig.add_subplot(gs[0, 1])
-    project_hours = df.groupby('project')['duration_min'].sum().sort_values(ascending=False) / 60
-    top_projects = project_hours.head(8)[::-1]
-    bars = ax2.barh(top_projects.index, top_projects.values, color='#f08c00')
-    ax2.set_xlabel('Total hours')
-    ax2.set_title('Top Projects')
-    for bar, value in zip(bars, top_projects.values):
-        ax2.text(
-            value + 0.1,
-            bar.get_y() + bar.get_height() / 2,
-            f'{value:.1f}h',
-            va='center',
+def render_visualization(ctx: ReportContext, output_path: Path, days: int, show: bool) -> Tuple[Figure, int]:
+    """Draw the four-panel chart, save it to output_path without printing anything, and return it with its size."""
+    if not show:
+        # Nothing is displayed, so skip GUI canvas setup and render straight to the Agg buffer
+        plt.switch_backend('Agg')
+    # Scope the stylesheet to this chart so global rcParams are left untouched
+    with plt.style.context('seaborn-v0_8'):
+        fig = plt.figure(figsize=(18, 12))
+        fig.suptitle('C2Switcher Session Insights', fontsize=18, fontweight='bold')
+        gs = fig.add_gridspec(2, 2, height_ratios=[1, 1.1], wspace=0.25, hspace=0.3)
+
+        # Panel 1: Daily hours trend
+        ax1 = fig.add_subplot(gs[0, 0])
+        daily = ctx.daily_hours
+        if days > 0:
+            daily = daily.tail(days)
+        rolling = daily.rolling(window=7, min_periods=1).mean()
+        # Only the arrays handed to matplotlib are downcast
+        daily_hours = daily.to_numpy(dtype=np.float32)
+        ax1.plot(
+            daily.index,
+            daily_hours,
+            marker='o',
+            linewidth=2,
+            label='Daily hours',
+            color='#2b8a3e',
         )
-
-    # Panel 3: Heatmap hour vs weekday
-    ax3 = fig.add_subplot(gs[1, 0])
-    weekdays = [
-        'Monday',
-        'Tuesday',
-        'Wednesday',
-        'Thursday',
-        'Friday',
-        'Saturday',
-        'Sunday',
-    ]
-    pivot = (
-        df.assign(weekday=pd.Categorical(df['weekday'], categories=weekdays, ordered=True))
-        .pivot_table(
-            index='weekday',
-            columns='hour',
-            values='duration_min',
-            aggfunc='sum',
-            fill_value=0,
-            observed=False,
+        ax1.plot(
+            rolling.index,
+            rolling.to_numpy(dtype=np.float32),
+            linestyle='--',
+            linewidth=2,
+            label='7-day avg',
+            color='#1971c2',
         )
-        .reindex(weekdays)
-        .fillna(0)
-    )
-    data = pivot.values
-    im = ax3.imshow(data, aspect='auto', cmap='YlGnBu')
-    ax3.set_title('Energy by Weekday & Hour')
-    ax3.set_xlabel('Hour of day')
-    ax3.set_ylabel('Weekday')
-    ax3.set_xticks(range(0, 24, 2))
-    ax3.set_xticklabels([f'{h:02d}' for h in range(0, 24, 2)])
-    ax3.set_yticks(range(len(pivot.index)))
-    ax3.set_yticklabels(pivot.index)
-    cbar = plt.colorbar(im, ax=ax3, shrink=0.8)
-    cbar.set_label('Minutes')
-
-    # Panel 4: Session length distribution
-    ax4 = fig.add_subplot(gs[1, 1])
-    durations = df['duration_min']
-    bins = np.linspace(0, min(240, durations.max() + 10), 30)
-    ax4.hist(durations, bins=bins, color='#748ffc', edgecolor='white', alpha=0.9)
-    ax4.axvline(durations.median(), color='#e03131', linestyle='--', linewidth=2, label='Median')
-    ax4.axvline(durations.mean(), color='#2f9e44', linestyle=':', linewidth=2, label='Mean')
-    ax4.set_xlabel('Session length (minutes)')
-    ax4.set_ylabel('Count')
-    ax4.set_title('Session Duration Distribution')
-    ax4.legend(frameon=False)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=200, bbox_inches='tight')
+        ax1.fill_between(daily.index, daily_hours, color='#2b8a3e', alpha=0.2, rasterized=True)
+        ax1.set_xlabel('Date')
+        ax1.set_ylabel('Hours')
+        ax1.set_title('Daily Focus Time')
+        ax1.grid(alpha=0.3)
+        ax1.legend(frameon=False)
+        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
+        plt.setp(ax1.get_xticklabels(), rotation=45, ha='right')
+
+        # Panel 2: Top projects bar
+        ax2 = fig.add_subplot(gs[0, 1])
+        project_hours = ctx.projects['hours']
+        top_projects = project_hours.head(8)[::-1]
+        bars = ax2.barh(top_projects.index, top_projects.to_numpy(dtype=np.float32), color='#f08c00', rasterized=True)
+        ax2.set_xlabel('Total hours')
+        ax2.set_title('Top Projects')
+        for bar, value in zip(bars, top_projects.values):
+            ax2.text(
+                value + 0.1,
+                bar.get_y() + bar.get_height() / 2,
+                f'{value:.1f}h',
+                va='center',
+            )
+
+        # Panel 3: Heatmap hour vs weekday
+        ax3 = fig.add_subplot(gs[1, 0])
+        im = ax3.imshow(ctx.weekday_hour.astype(np.float32), aspect='auto', cmap='YlGnBu', rasterized=True)
+        ax3.set_title('Energy by Weekday & Hour')
+        ax3.set_xlabel('Hour of day')
+        ax3.set_ylabel('Weekday')
+        ax3.set_xticks(range(0, 24, 2))
+        ax3.set_xticklabels([f'{h:02d}' for h in range(0, 24, 2)])
+        ax3.set_yticks(range(len(WEEKDAYS)))
+        ax3.set_yticklabels(WEEKDAYS)
+        cbar = plt.colorbar(im, ax=ax3, shrink=0.8)
+        cbar.set_label('Minutes')
+
+        # Panel 4: Session length distribution
+        ax4 = fig.add_subplot(gs[1, 1])
+        # Counts are prebinned in the context; matplotlib only lays out the bars
+        metrics = ctx.metrics
+        bins = ctx.duration_bins
+        ax4.bar(
+            bins[:-1],
+            ctx.duration_counts,
+            width=np.diff(bins),
+            align='edge',
+            color='#748ffc',
+            edgecolor='white',
+            alpha=0.9,
+            rasterized=True,
+        )
+        ax4.axvline(metrics.median_session_min, color='#e03131', linestyle='--', linewidth=2, label='Median')
+        mean_min = metrics.total_minutes / metrics.total_sessions
+        ax4.axvline(mean_min, color='#2f9e44', linestyle=':', linewidth=2, label='Mean')
+        ax4.set_xlabel('Session length (minutes)')
+        ax4.set_ylabel('Count')
+        ax4.set_title('Session Duration Distribution')
+        ax4.legend(frameon=False)
+
+        # Encoding into memory gives the size directly, without a stat of the file just written
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(buf.getvalue())
+    return fig, buf.tell()
+
+
+def create_visualizations(
+    ctx: ReportContext,
+    output_path: Path,
+    days: int,
+    show: bool,
+) -> None:
+    rendered = render_visualization(ctx, output_path, days, show)
     console.print(f'[bold green]✓[/] Saved visualization to [link=file://{output_path}]{output_path}[/]')
-
-    if output_path.exists():
-        console.print(f'[dim]Figure size: {output_path.stat().st_size / 1024:.1f} KiB[/]')
+    console.print(f'[dim]Figure size: {rendered[1] / 1024:.1f} KiB[/]')
 
     webbrowser.open(f'file://{output_path.absolute()}')
 
     if show:
         plt.show()
     else:
-        plt.close(fig)
+        plt.close('all')
+
+
+def _print_sections(ctx: ReportContext) -> None:
+    console.print(activity_snapshot_panel(ctx))
+    console.print()
+    console.print(project_cards(ctx))
+    console.print()
+    console.print(project_detail_table(ctx))
+    console.print()
+    console.print(focus_windows_table(ctx))
+    console.print()
+    console.print(account_mix_table(ctx))
+    console.print()
+    console.print(momentum_panel(ctx))
+    console.print()
+    console.print(recommendations_panel(ctx))
+    console.print('\n[bold cyan]Generating visualization…[/]')
 
 
 def generate_session_report(
@@ -584,21 +719,9 @@ def generate_session_report(
         console.print('[yellow]No sessions found that match the filters.[/]')
         return
 
-    metrics = compute_session_metrics(df)
+    # One clock read for every relative timestamp in the report
+    ctx = build_report_context(df, datetime.now())
 
-    console.print(activity_snapshot_panel(metrics))
-    console.print()
-    console.print(project_cards(df))
-    console.print()
-    console.print(project_detail_table(df))
-    console.print()
-    console.print(focus_windows_table(df))
-    console.print()
-    console.print(account_mix_table(df))
-    console.print()
-    console.print(momentum_panel(df, metrics))
-    console.print()
-    console.print(recommendations_panel(df, metrics))
-
-    console.print('\n[bold cyan]Generating visualization…[/]')
-    create_visualizations(df, output_path, days, show)
+    # pyplot state is not thread-safe, so the chart is drawn on this thread once the tables are printed
+    _print_sections(ctx)
+    create_visualizations(ctx, output_path, days, show)
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
 import math
 import sqlite3
+import time
 import webbrowser
 from collections import Counter
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.axes import Axes
 from matplotlib.lines import Line2D
 from rich import box
 from rich.columns import Columns
@@ -22,70 +28,156 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-console = Console()
-
+from ..constants import USAGE_CHART_HASH_PATH
 
-def load_usage_history(db_path: Path) -> pd.DataFrame:
-    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
-    query = """
-        SELECT
-            uh.id,
-            uh.account_uuid,
-            uh.queried_at,
-            uh.five_hour_utilization,
-            uh.five_hour_resets_at,
-            uh.seven_day_utilization,
-            uh.seven_day_resets_at,
-            uh.seven_day_sonnet_utilization,
-            uh.seven_day_sonnet_resets_at,
-            a.nickname,
-            a.display_name,
-            a.email
-        FROM usage_history uh
-        LEFT JOIN accounts a ON uh.account_uuid = a.uuid
-        ORDER BY uh.queried_at ASC;
-    """
-
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-
-    if df.empty:
-        return df
-
-    time_cols = [
+console = Console()
+_USAGE_CHUNK_ROWS = 50_000
+# Samples per plotted series; a panel is well under 1000 px wide
+_PLOT_POINTS = 500
+_USAGE_TIME_COLS = frozenset(
+    {
         'queried_at',
         'five_hour_resets_at',
         'seven_day_resets_at',
         'seven_day_sonnet_resets_at',
-    ]
-    datetime_updates = {
-        col: pd.to_datetime(df[col], utc=True, errors='coerce').dt.tz_localize(None) for col in time_cols
     }
-    df = df.assign(**datetime_updates)
-
-    df = df.assign(account=df['nickname'].fillna(df['display_name']).fillna('unknown'))
-
-    numeric_cols = [
+)
+_USAGE_NUMERIC_COLS = frozenset(
+    {
         'five_hour_utilization',
         'seven_day_utilization',
         'seven_day_sonnet_utilization',
-    ]
-    numeric_updates = {col: pd.to_numeric(df[col], errors='coerce') for col in numeric_cols}
-    df = df.assign(**numeric_updates)
+    }
+)
 
-    return df
 
+def load_usage_history(db_path: Path, window_hours: int, chart_start_sec: int) -> pd.DataFrame:
+    # Trim history before the chart window except rows a fit needs; time order sets first-seen account order
+    query = """
+        WITH bounds AS (
+            SELECT
+                b.account_uuid,
+                MIN(
+                    :cutoff,
+                    COALESCE(datetime(b.last_at, :fit_window), ''),
+                    COALESCE(
+                        (
+                            SELECT h.queried_at
+                            FROM usage_history h
+                            WHERE h.account_uuid = b.account_uuid
+                            ORDER BY h.queried_at DESC
+                            LIMIT 1 OFFSET 4
+                        ),
+                        ''
+                    )
+                ) AS since
+            FROM (
+                SELECT account_uuid, MAX(queried_at) AS last_at
+                FROM usage_history
+                GROUP BY account_uuid
+            ) b
+        )
+        SELECT
+            CAST(strftime('%s', uh.queried_at) AS INTEGER) AS queried_at,
+            CAST(uh.five_hour_utilization AS REAL) AS five_hour_utilization,
+            CAST(strftime('%s', uh.five_hour_resets_at) AS INTEGER) AS five_hour_resets_at,
+            CAST(uh.seven_day_utilization AS REAL) AS seven_day_utilization,
+            CAST(strftime('%s', uh.seven_day_resets_at) AS INTEGER) AS seven_day_resets_at,
+            CAST(uh.seven_day_sonnet_utilization AS REAL) AS seven_day_sonnet_utilization,
+            CAST(strftime('%s', uh.seven_day_sonnet_resets_at) AS INTEGER) AS seven_day_sonnet_resets_at,
+            COALESCE(a.nickname, a.display_name, 'unknown') AS account
+        FROM bounds
+        JOIN usage_history uh ON uh.account_uuid = bounds.account_uuid AND uh.queried_at >= bounds.since
+        LEFT JOIN accounts a ON uh.account_uuid = a.uuid
+        ORDER BY uh.queried_at ASC, uh.id ASC;
+    """
+    params = {
+        'cutoff': time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(chart_start_sec)),
+        'fit_window': f'-{window_hours} hours',
+    }
 
-def slope_per_hour(series: pd.Series, times: pd.Series) -> float:
-    if len(series) < 2:
-        return 0.0
-    elapsed = (times - times.iloc[0]).dt.total_seconds() / 3600
-    if (elapsed == 0).all():
-        return 0.0
-    slope, _ = np.polyfit(elapsed, series, 1)
-    return max(0.0, slope)
+    with closing(sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)) as conn:
+        # Memory-map the file and enlarge the page cache for the sequential scan
+        conn.execute('PRAGMA query_only=1')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-65536')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        cursor = conn.execute(query, params)
+        names = [description[0] for description in cursor.description]
+        # Convert each batch as it arrives so only one batch of row tuples is alive at a time
+        chunks = []
+        while True:
+            rows = cursor.fetchmany(_USAGE_CHUNK_ROWS)
+            if not rows:
+                break
+            chunks.append(_usage_arrays(names, rows))
+        if not chunks:
+            chunks.append(_usage_arrays(names, []))
+
+    # Categories are assigned after concatenation so every batch shares one set
+    df = pd.DataFrame({name: np.concatenate([chunk[name] for chunk in chunks]) for name in names})
+    df['account'] = df['account'].astype('category')
+    return df
 
 
+def _usage_arrays(names: List[str], rows: List[tuple]) -> Dict[str, np.ndarray]:
+    # NumPy maps NULL (None) to NaT/NaN while filling the typed arrays
+    columns = zip(*rows) if rows else ((),) * len(names)
+    arrays = {}
+    for name, values in zip(names, columns):
+        if name in _USAGE_TIME_COLS:
+            arrays[name] = np.array(values, dtype='datetime64[s]')
+        elif name in _USAGE_NUMERIC_COLS:
+            arrays[name] = np.array(values, dtype=np.float32)
+        else:
+            arrays[name] = np.array(values, dtype=object)
+    return arrays
+
+
+def fit_burn_rates(df: pd.DataFrame, window_hours: int) -> pd.DataFrame:
+    """Least-squares 7d and Sonnet burn rates (%/h) per account over window_hours (or the last 5 samples)."""
+    codes, accounts = pd.factorize(df['account'])
+    # History arrives in time order, so a stable sort by account keeps every run sorted by time
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    times = df['queried_at'].to_numpy()[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)]
+
+    window = np.timedelta64(window_hours, 'h')
+    lo = np.array(
+        [start + np.searchsorted(times[start:end], times[end - 1] - window) for start, end in zip(starts, ends)],
+        dtype=np.intp,
+    )
+    lo = np.where(ends - lo >= 2, lo, np.maximum(starts, ends - 5))
+
+    # Gather the selected tail of every run into consecutive segments
+    lengths = ends - lo
+    offsets = np.r_[0, np.cumsum(lengths)[:-1]]
+    rows = np.repeat(lo - offsets, lengths) + np.arange(lengths.sum())
+    # Hours before each account's latest sample
+    x = (times[rows] - np.repeat(times[ends - 1], lengths)) / np.timedelta64(1, 's') / 3600
+
+    rates = {}
+    for name, col in (('rate_7d', 'seven_day_utilization'), ('rate_sonnet', 'seven_day_sonnet_utilization')):
+        y = df[col].to_numpy(dtype=float)[order][rows]
+        # Leave missing readings out of every sum
+        valid = np.isfinite(y)
+        n = np.add.reduceat(valid, offsets)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_mean = np.add.reduceat(np.where(valid, x, 0.0), offsets) / n
+            dx = np.where(valid, x - np.repeat(x_mean, lengths), 0.0)
+            # dx sums to zero over the valid samples, so sum(dx * y) equals the centered cross term
+            sxx = np.add.reduceat(dx * dx, offsets)
+            sxy = np.add.reduceat(dx * np.where(valid, y, 0.0), offsets)
+            slope = sxy / sxx
+        # Fewer than two valid readings, or a single timestamp, leaves no slope to fit
+        rates[name] = np.where((n >= 2) & np.isfinite(slope) & (slope > 0), slope, 0.0)
+    return pd.DataFrame(rates, index=accounts)
+
+
+# Panels, cards and the playbook format the same few horizons repeatedly
+@lru_cache(maxsize=256)
 def format_horizon(hours: Optional[float]) -> str:
     if hours is None or hours == float('inf'):
         return '—'
@@ -96,7 +188,17 @@ def format_horizon(hours: Optional[float]) -> str:
     return f'{hours * 60:.0f}m'
 
 
-@dataclass
+def format_horizons(hours: np.ndarray) -> List[str]:
+    """format_horizon over a whole column at once; NaN stands in for a missing horizon."""
+    text = np.select(
+        [~np.isfinite(hours), hours >= 48, hours >= 1],
+        [np.full(hours.shape, '—'), np.char.mod('%.1fd', hours / 24), np.char.mod('%.1fh', hours)],
+        default=np.char.mod('%.0fm', hours * 60),
+    )
+    return text.tolist()
+
+
+@dataclass(frozen=True)
 class AccountForecast:
     account: str
     latest_timestamp: datetime
@@ -110,6 +212,7 @@ class AccountForecast:
     hours_until_7d_reset: Optional[float]
     hours_until_sonnet_reset: Optional[float]
     hours_until_5h_reset: Optional[float]
+    hours_until_next_reset: Optional[float]
     hits_7d_before_reset: bool
     hits_sonnet_before_reset: bool
     first_limit_type: Optional[str]
@@ -119,104 +222,80 @@ class AccountForecast:
     reset_7d_at: Optional[datetime]
     reset_sonnet_at: Optional[datetime]
 
-
-def forecast_account(acc_df: pd.DataFrame, window_hours: int) -> Optional[AccountForecast]:
-    if acc_df.empty:
-        return None
-
-    latest = acc_df.iloc[-1]
-    now = latest['queried_at']
-
-    window_start = now - timedelta(hours=window_hours)
-    recent = acc_df[acc_df['queried_at'] >= window_start]
-    if len(recent) < 2:
-        recent = acc_df.tail(5)
-
-    rate_7d = slope_per_hour(recent['seven_day_utilization'], recent['queried_at'])
-    rate_sonnet = slope_per_hour(recent['seven_day_sonnet_utilization'], recent['queried_at'])
-
-    current_7d = float(latest['seven_day_utilization'] or 0)
-    current_sonnet = float(latest['seven_day_sonnet_utilization'] or 0)
-    current_5h = float(latest['five_hour_utilization'] or 0)
-
-    def hours_until(reset_time: Optional[datetime]) -> Optional[float]:
-        if pd.isna(reset_time):
-            return None
-        delta = (reset_time - now).total_seconds() / 3600
-        return max(0.0, delta)
-
-    reset_7d_at = latest['seven_day_resets_at']
-    reset_sonnet_at = latest['seven_day_sonnet_resets_at']
-
-    hours_until_7d_reset = hours_until(reset_7d_at)
-    hours_until_sonnet_reset = hours_until(reset_sonnet_at)
-    hours_until_5h_reset = hours_until(latest['five_hour_resets_at'])
-
-    def hours_to_cap(current: float, rate: float) -> float:
-        if rate <= 0:
-            return float('inf')
-        return max(0.0, (100 - current) / rate)
-
-    hours_to_cap_7d = hours_to_cap(current_7d, rate_7d)
-    hours_to_cap_sonnet = hours_to_cap(current_sonnet, rate_sonnet)
-
-    hits_7d_before_reset = hours_to_cap_7d != float('inf') and (
-        hours_until_7d_reset is None or hours_to_cap_7d < hours_until_7d_reset
-    )
-    hits_sonnet_before_reset = hours_to_cap_sonnet != float('inf') and (
-        hours_until_sonnet_reset is None or hours_to_cap_sonnet < hours_until_sonnet_reset
+    # dataclass(slots=True) needs Python 3.10; the fields have no defaults, so plain __slots__ works
+    __slots__ = tuple(__annotations__)
+
+
+def forecast_accounts(latest: pd.DataFrame, rates: pd.DataFrame) -> List[AccountForecast]:
+    """Forecast every account at once from its latest sample (one row per account) and its burn rates."""
+    now = latest['queried_at'].to_numpy()
+    current_7d = latest['seven_day_utilization'].to_numpy(dtype=float)
+    current_sonnet = latest['seven_day_sonnet_utilization'].to_numpy(dtype=float)
+    current_5h = latest['five_hour_utilization'].to_numpy(dtype=float)
+    rate_7d = rates['rate_7d'].to_numpy(dtype=float)
+    rate_sonnet = rates['rate_sonnet'].to_numpy(dtype=float)
+
+    # (accounts, 3) hours until each reset; unknown resets come out as NaN
+    resets = latest[['seven_day_resets_at', 'seven_day_sonnet_resets_at', 'five_hour_resets_at']].to_numpy()
+    until_7d, until_sonnet, until_5h = np.maximum(0.0, (resets - now[:, None]) / np.timedelta64(1, 's') / 3600).T
+    # Soonest of the two weekly resets
+    until_next = np.fmin(until_7d, until_sonnet)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # fmax also floors a missing reading to zero hours, as max(0.0, nan) did
+        cap_7d = np.where(rate_7d > 0, np.fmax(0.0, (100 - current_7d) / rate_7d), np.inf)
+        cap_sonnet = np.where(rate_sonnet > 0, np.fmax(0.0, (100 - current_sonnet) / rate_sonnet), np.inf)
+
+    hits_7d = np.isfinite(cap_7d) & (np.isnan(until_7d) | (cap_7d < until_7d))
+    hits_sonnet = np.isfinite(cap_sonnet) & (np.isnan(until_sonnet) | (cap_sonnet < until_sonnet))
+
+    # The 7-day overall cap wins ties with the Sonnet cap
+    first_is_7d = hits_7d & ~(hits_sonnet & (cap_sonnet < cap_7d))
+    first_is_sonnet = hits_sonnet & ~first_is_7d
+    first_hours = np.select([first_is_7d, first_is_sonnet], [cap_7d, cap_sonnet], default=np.inf)
+    first_type = np.select([first_is_7d, first_is_sonnet], ['7-day overall', '7-day Sonnet'], default='')
+    status = np.select(
+        [first_type == '', first_hours < 6, first_hours < 24],
+        ['🟢 Reset', '🔴 Critical', '🟡 Watch'],
+        default='🟢 OK',
     )
 
-    limit_candidates = []
-    if hits_7d_before_reset:
-        limit_candidates.append(('7-day overall', hours_to_cap_7d))
-    if hits_sonnet_before_reset:
-        limit_candidates.append(('7-day Sonnet', hours_to_cap_sonnet))
-
-    if limit_candidates:
-        first_limit_type, first_limit_hours = min(limit_candidates, key=lambda item: item[1])
-    else:
-        first_limit_type, first_limit_hours = (None, float('inf'))
-
-    if first_limit_type is None:
-        status = '🟢 Reset'
-        resets = [val for val in (hours_until_7d_reset, hours_until_sonnet_reset) if val is not None]
-        if resets:
-            soonest_reset = min(resets)
-            headline = f'Resets in {format_horizon(soonest_reset)} before limits'
+    def optional(hours: np.ndarray) -> List[Optional[float]]:
+        return [None if math.isnan(value) else value for value in hours.tolist()]
+
+    columns = {
+        'account': latest['account'].tolist(),
+        'latest_timestamp': latest['queried_at'].tolist(),
+        'current_7d': current_7d.tolist(),
+        'current_sonnet': current_sonnet.tolist(),
+        'current_5h': current_5h.tolist(),
+        'rate_7d': rate_7d.tolist(),
+        'rate_sonnet': rate_sonnet.tolist(),
+        'hours_to_cap_7d': cap_7d.tolist(),
+        'hours_to_cap_sonnet': cap_sonnet.tolist(),
+        'hours_until_7d_reset': optional(until_7d),
+        'hours_until_sonnet_reset': optional(until_sonnet),
+        'hours_until_5h_reset': optional(until_5h),
+        'hours_until_next_reset': optional(until_next),
+        'hits_7d_before_reset': hits_7d.tolist(),
+        'hits_sonnet_before_reset': hits_sonnet.tolist(),
+        'first_limit_type': [limit_type or None for limit_type in first_type.tolist()],
+        'first_limit_hours': first_hours.tolist(),
+        'status': status.tolist(),
+        'reset_7d_at': latest['seven_day_resets_at'].tolist(),
+        'reset_sonnet_at': latest['seven_day_sonnet_resets_at'].tolist(),
+    }
+    forecasts = []
+    for row in zip(*columns.values()):
+        fields = dict(zip(columns, row))
+        if fields['first_limit_type']:
+            headline = f"{fields['first_limit_type']} limit in {format_horizon(fields['first_limit_hours'])}"
+        elif fields['hours_until_next_reset'] is not None:
+            headline = f"Resets in {format_horizon(fields['hours_until_next_reset'])} before limits"
         else:
             headline = 'Usage steady; no limits projected'
-    else:
-        if first_limit_hours < 6:
-            status = '🔴 Critical'
-        elif first_limit_hours < 24:
-            status = '🟡 Watch'
-        else:
-            status = '🟢 OK'
-        headline = f'{first_limit_type} limit in {format_horizon(first_limit_hours)}'
-
-    return AccountForecast(
-        account=latest['account'],
-        latest_timestamp=now,
-        current_7d=current_7d,
-        current_sonnet=current_sonnet,
-        current_5h=current_5h,
-        rate_7d=rate_7d,
-        rate_sonnet=rate_sonnet,
-        hours_to_cap_7d=hours_to_cap_7d,
-        hours_to_cap_sonnet=hours_to_cap_sonnet,
-        hours_until_7d_reset=hours_until_7d_reset,
-        hours_until_sonnet_reset=hours_until_sonnet_reset,
-        hours_until_5h_reset=hours_until_5h_reset,
-        hits_7d_before_reset=hits_7d_before_reset,
-        hits_sonnet_before_reset=hits_sonnet_before_reset,
-        first_limit_type=first_limit_type,
-        first_limit_hours=first_limit_hours,
-        status=status,
-        headline=headline,
-        reset_7d_at=reset_7d_at,
-        reset_sonnet_at=reset_sonnet_at,
-    )
+        forecasts.append(AccountForecast(**fields, headline=headline))
+    return forecasts
 
 
 @dataclass
@@ -230,8 +309,8 @@ class FleetMetrics:
     recommended_fleet: int
     headroom: int
     shortfall: int
-    at_risk_accounts: list[str]
-    soonest_limit: Optional[tuple[str, str, float]]
+    at_risk_accounts: List[str]
+    soonest_limit: Optional[Tuple[str, str, float]]
     nearest_reset: Optional[float]
 
 
@@ -247,6 +326,8 @@ def _usage_color(value: Optional[float]) -> str:
     return 'cyan'
 
 
+# Cards and the outlook table format the same few readings repeatedly
+@lru_cache(maxsize=256)
 def _colorize_percent(value: Optional[float]) -> str:
     if value is None:
         return '[dim]--[/dim]'
@@ -254,6 +335,7 @@ def _colorize_percent(value: Optional[float]) -> str:
     return f'[{color}]{value:.0f}%[/]'
 
 
+@lru_cache(maxsize=256)
 def _colorize_rate(rate: float) -> str:
     if rate >= 2:
         return f'[red]{rate:.2f}%/h[/red]'
@@ -264,6 +346,7 @@ def _colorize_rate(rate: float) -> str:
     return '[dim]0.00%/h[/dim]'
 
 
+@lru_cache(maxsize=256)
 def _usage_bar(value: Optional[float], width: int = 12) -> str:
     if value is None:
         return '[dim]' + '·' * width + '[/dim]'
@@ -277,11 +360,27 @@ def _usage_bar(value: Optional[float], width: int = 12) -> str:
 
 def compute_fleet_metrics(forecasts: Iterable[AccountForecast]) -> FleetMetrics:
     forecasts = list(forecasts)
-    status_counts: Counter[str] = Counter(f.status for f in forecasts)
     per_account_capacity = 100 / (7 * 24)
 
-    total_rate_7d = sum(max(f.rate_7d, 0.0) for f in forecasts)
-    total_rate_sonnet = sum(max(f.rate_sonnet, 0.0) for f in forecasts)
+    # Strict comparisons keep the first account on ties
+    status_counts: Counter[str] = Counter()
+    total_rate_7d = 0.0
+    total_rate_sonnet = 0.0
+    at_risk_accounts: List[str] = []
+    soonest_limit: Optional[Tuple[str, str, float]] = None
+    nearest_reset: Optional[float] = None
+    for f in forecasts:
+        status_counts[f.status] += 1
+        total_rate_7d += max(f.rate_7d, 0.0)
+        total_rate_sonnet += max(f.rate_sonnet, 0.0)
+        if f.hits_7d_before_reset or f.hits_sonnet_before_reset:
+            at_risk_accounts.append(f.account)
+        if f.first_limit_type and f.first_limit_hours != float('inf'):
+            if soonest_limit is None or f.first_limit_hours < soonest_limit[2]:
+                soonest_limit = (f.account, f.first_limit_type, f.first_limit_hours)
+        if f.hours_until_next_reset is not None:
+            if nearest_reset is None or f.hours_until_next_reset < nearest_reset:
+                nearest_reset = f.hours_until_next_reset
 
     def required_accounts(total_rate: float) -> int:
         if total_rate <= 0:
@@ -292,20 +391,6 @@ def compute_fleet_metrics(forecasts: Iterable[AccountForecast]) -> FleetMetrics:
     required_sonnet = required_accounts(total_rate_sonnet)
     recommended_fleet = max(required_overall, required_sonnet)
 
-    at_risk_accounts = [f.account for f in forecasts if f.hits_7d_before_reset or f.hits_sonnet_before_reset]
-
-    limit_candidates = [
-        (f.account, f.first_limit_type, f.first_limit_hours)
-        for f in forecasts
-        if f.first_limit_type and f.first_limit_hours != float('inf')
-    ]
-    soonest_limit = min(limit_candidates, key=lambda item: item[2]) if limit_candidates else None
-
-    reset_candidates = [
-        value for f in forecasts for value in (f.hours_until_7d_reset, f.hours_until_sonnet_reset) if value is not None
-    ]
-    nearest_reset = min(reset_candidates) if reset_candidates else None
-
     headroom = max(0, len(forecasts) - recommended_fleet) if recommended_fleet else len(forecasts)
     shortfall = max(0, recommended_fleet - len(forecasts))
 
@@ -426,18 +511,21 @@ def limit_outlook_table(forecasts: Iterable[AccountForecast]) -> Optional[Table]
         '🟢 Reset': 3,
     }
 
-    for f in forecasts:
-        reset_candidates = [val for val in (f.hours_until_7d_reset, f.hours_until_sonnet_reset) if val is not None]
-        reset_eta = min(reset_candidates) if reset_candidates else None
+    forecasts = list(forecasts)
+    reset_etas = [f.hours_until_next_reset for f in forecasts]
+    # Horizons for the whole fleet are formatted in one vectorized pass per column
+    limit_texts = format_horizons(np.array([f.first_limit_hours for f in forecasts], dtype=float))
+    reset_texts = format_horizons(np.array([math.nan if eta is None else eta for eta in reset_etas], dtype=float))
 
+    for f, reset_eta, limit_text, reset_text in zip(forecasts, reset_etas, limit_texts, reset_texts):
         if f.first_limit_type:
             threat = f.first_limit_type
             eta_hours = f.first_limit_hours
-            eta_display = format_horizon(f.first_limit_hours)
+            eta_display = limit_text
         else:
             threat = 'Resets first'
             eta_hours = reset_eta if reset_eta is not None else float('inf')
-            eta_display = f'Reset in {format_horizon(reset_eta)}' if reset_eta is not None else 'Steady'
+            eta_display = f'Reset in {reset_text}' if reset_eta is not None else 'Steady'
 
         rows.append(
             {
@@ -446,11 +534,18 @@ def limit_outlook_table(forecasts: Iterable[AccountForecast]) -> Optional[Table]
                 'eta_hours': eta_hours,
                 'eta_display': eta_display,
                 'threat': threat,
-                'reset_eta': reset_eta,
+                'reset_display': reset_text,
             }
         )
 
-    rows.sort(key=lambda item: (item['severity'], item['eta_hours']))
+    # One stable C sort on (severity, eta) instead of comparing Python tuples pairwise
+    order = np.lexsort(
+        (
+            np.fromiter((item['eta_hours'] for item in rows), dtype=np.float64, count=len(rows)),
+            np.fromiter((item['severity'] for item in rows), dtype=np.int8, count=len(rows)),
+        )
+    )
+    rows = [rows[i] for i in order]
 
     table = Table(
         title='Limit Outlook',
@@ -469,12 +564,11 @@ def limit_outlook_table(forecasts: Iterable[AccountForecast]) -> Optional[Table]
 
     for item in rows:
         f = item['forecast']
-        reset_display = format_horizon(item['reset_eta']) if item['reset_eta'] is not None else '—'
         table.add_row(
             f'{f.status} {f.account}',
             item['threat'],
             item['eta_display'],
-            reset_display,
+            item['reset_display'],
             _colorize_percent(f.current_7d),
             _colorize_percent(f.current_sonnet),
             _colorize_rate(f.rate_7d),
@@ -513,6 +607,122 @@ def playbook_panel(forecasts: Iterable[AccountForecast], metrics: FleetMetrics)
     return Panel(body, title='Playbook', border_style='cyan', box=box.ROUNDED)
 
 
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of n_out points that preserve a series' visual shape."""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    picked = np.empty(n_out, dtype=np.intp)
+    picked[0], picked[-1] = 0, n - 1
+    prev = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_x = x[hi : edges[bucket + 2]].mean()
+            next_y = y[hi : edges[bucket + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[prev] - next_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (next_y - y[prev]))
+        # Missing readings never win a bucket
+        prev = lo + int(np.argmax(np.where(np.isnan(area), -1.0, area)))
+        picked[bucket + 1] = prev
+    return picked
+
+
+def _plot_points(times: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Thin a series for plotting once it has far more points than the panel has pixels."""
+    if len(times) <= 2 * _PLOT_POINTS:
+        return times, values
+    elapsed = (times - times[0]).astype('timedelta64[s]').astype(np.float64)
+    picked = _lttb_indices(elapsed, values.astype(np.float64), _PLOT_POINTS)
+    return times[picked], values[picked]
+
+
+def _plot_utilization_panel(
+    ax: Axes,
+    forecasts: List[AccountForecast],
+    series: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]],
+    key: str,
+    title: str,
+    quota: Optional[str] = None,
+    limit_style: str = '--',
+    limit_label: Optional[str] = None,
+) -> None:
+    """Plot one utilization history per account; with quota set, add resets, projections and cap markers."""
+    line_style = {'marker': 'o', 'markersize': 3} if quota else {}
+    quota_fields = (
+        attrgetter(
+            f'reset_{quota}_at',
+            f'rate_{quota}',
+            f'hours_to_cap_{quota}',
+            f'hours_until_{quota}_reset',
+            f'current_{quota}',
+            f'hits_{quota}_before_reset',
+        )
+        if quota
+        else None
+    )
+    for forecast in forecasts:
+        acc_data = series.get(forecast.account)
+        if acc_data is None:
+            continue
+        (line,) = ax.plot(*acc_data[key], linewidth=2, label=f'{forecast.account}', rasterized=True, **line_style)
+        if quota_fields is None:
+            continue
+        color = line.get_color()
+        reset_at, rate, hours_to_cap, hours_until_reset, current, hits_before_reset = quota_fields(forecast)
+
+        if reset_at is not None and not pd.isna(reset_at):
+            ax.axvline(reset_at, color=color, linestyle=':', alpha=0.35)
+        if rate > 0:
+            horizon = hours_to_cap
+            if hours_until_reset is not None:
+                horizon = min(horizon, hours_until_reset)
+            if horizon != float('inf') and horizon > 0:
+                end_time = forecast.latest_timestamp + timedelta(hours=horizon)
+                end_value = current + rate * horizon
+                ax.plot(
+                    [forecast.latest_timestamp, end_time],
+                    [current, min(100, end_value)],
+                    linestyle='--',
+                    color=color,
+                    alpha=0.85,
+                )
+        if hits_before_reset and hours_to_cap != float('inf'):
+            limit_time = forecast.latest_timestamp + timedelta(hours=hours_to_cap)
+            ax.scatter(limit_time, 100, color=color, marker='x', zorder=5)
+
+    ax.axhline(100, color='#e03131', linestyle=limit_style, linewidth=2, label=limit_label)
+    ax.set_title(title)
+    ax.set_ylabel('Usage %')
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.grid(alpha=0.3)
+    ax.legend(loc='upper left', frameon=False)
+    ax.set_ylim(0, 110)
+
+
+def _chart_fingerprint(df: pd.DataFrame, forecasts: List[AccountForecast], output_path: Path) -> str:
+    """Digest of where the dashboard is saved and everything it draws: the history and each forecast."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(output_path.resolve()).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(repr(forecasts).encode())
+    return digest.hexdigest()
+
+
+def _chart_is_current(output_path: Path, fingerprint: str) -> bool:
+    """Whether the chart at output_path was saved by the render that stored this fingerprint."""
+    try:
+        chart_mtime = output_path.stat().st_mtime
+        hash_mtime = USAGE_CHART_HASH_PATH.stat().st_mtime
+    except OSError:
+        return False
+    # A chart written after the hash was replaced or regenerated by something else
+    return chart_mtime <= hash_mtime and USAGE_CHART_HASH_PATH.read_text() == fingerprint
+
+
 def create_visualizations(
     df: pd.DataFrame,
     forecasts: Iterable[AccountForecast],
@@ -520,212 +730,134 @@ def create_visualizations(
     show: bool,
 ) -> None:
     forecasts = list(forecasts)
-    plt.style.use('seaborn-v0_8')
-
-    fig = plt.figure(figsize=(18, 12))
-    fig.suptitle('C2Switcher Usage Risk Dashboard', fontsize=18, fontweight='bold')
-    gs = fig.add_gridspec(2, 2, height_ratios=[1.1, 1], wspace=0.25, hspace=0.3)
-
-    accounts = [f.account for f in forecasts]
-    forecast_map = {f.account: f for f in forecasts}
+    fingerprint = None
+    if not show:
+        # Skip the render when the saved chart was drawn from the same snapshot
+        fingerprint = _chart_fingerprint(df, forecasts, output_path)
+        if _chart_is_current(output_path, fingerprint):
+            console.print(f'[bold green]✓[/] Visualization unchanged at [link=file://{output_path}]{output_path}[/]')
+            webbrowser.open(f'file://{output_path.absolute()}')
+            return
+
+    if not show:
+        # Nothing is displayed, so skip GUI canvas setup and render straight to the Agg buffer
+        plt.switch_backend('Agg')
+    # Scope the stylesheet to this chart so global rcParams are left untouched
+    with plt.style.context('seaborn-v0_8'):
+        fig = plt.figure(figsize=(18, 12))
+        fig.suptitle('C2Switcher Usage Risk Dashboard', fontsize=18, fontweight='bold')
+        gs = fig.add_gridspec(2, 2, height_ratios=[1.1, 1], wspace=0.25, hspace=0.3)
+
+        accounts = [f.account for f in forecasts]
+        # Per-account plot arrays, split once and thinned for long histories
+        series = {}
+        for account, sub in df.groupby('account', sort=False, observed=True):
+            times = sub['queried_at'].to_numpy()
+            series[account] = {
+                name: _plot_points(times, sub[col].to_numpy(dtype=np.float32))
+                for name, col in (
+                    ('7d', 'seven_day_utilization'),
+                    ('sonnet', 'seven_day_sonnet_utilization'),
+                    ('5h', 'five_hour_utilization'),
+                )
+            }
 
-    # Panel 1: 7-day overall utilization trend
-    ax1 = fig.add_subplot(gs[0, 0])
-    for account in accounts:
-        acc_data = df[df['account'] == account]
-        if acc_data.empty:
-            continue
-        forecast = forecast_map.get(account)
-        (line,) = ax1.plot(
-            acc_data['queried_at'],
-            acc_data['seven_day_utilization'],
-            marker='o',
-            linewidth=2,
-            markersize=3,
-            label=f'{account}',
+        # Panels 1 and 2: 7-day overall and Sonnet utilization with each account's projection
+        ax1 = fig.add_subplot(gs[0, 0])
+        _plot_utilization_panel(
+            ax1, forecasts, series, '7d', '7-Day Overall Utilization', quota='7d', limit_label='Limit'
         )
-        color = line.get_color()
+        ax2 = fig.add_subplot(gs[0, 1])
+        _plot_utilization_panel(ax2, forecasts, series, 'sonnet', '7-Day Sonnet Utilization', quota='sonnet')
 
-        if forecast:
+        # Panel 3: Upcoming resets vs limits timeline
+        ax3 = fig.add_subplot(gs[1, 0])
+        event_times = []
+        for y, forecast in enumerate(forecasts):
             if forecast.reset_7d_at is not None and not pd.isna(forecast.reset_7d_at):
-                ax1.axvline(forecast.reset_7d_at, color=color, linestyle=':', alpha=0.35)
-            if forecast.rate_7d > 0:
-                horizon = forecast.hours_to_cap_7d
-                if forecast.hours_until_7d_reset is not None:
-                    horizon = min(horizon, forecast.hours_until_7d_reset)
-                if horizon != float('inf') and horizon > 0:
-                    end_time = forecast.latest_timestamp + timedelta(hours=horizon)
-                    end_value = forecast.current_7d + forecast.rate_7d * horizon
-                    ax1.plot(
-                        [forecast.latest_timestamp, end_time],
-                        [forecast.current_7d, min(100, end_value)],
-                        linestyle='--',
-                        color=color,
-                        alpha=0.85,
-                    )
+                ax3.scatter(forecast.reset_7d_at, y, marker='^', color='#1c7ed6', s=70, zorder=4)
+                event_times.append(forecast.reset_7d_at)
+            if forecast.reset_sonnet_at is not None and not pd.isna(forecast.reset_sonnet_at):
+                ax3.scatter(forecast.reset_sonnet_at, y, marker='v', color='#7048e8', s=70, zorder=4)
+                event_times.append(forecast.reset_sonnet_at)
             if forecast.hits_7d_before_reset and forecast.hours_to_cap_7d != float('inf'):
                 limit_time = forecast.latest_timestamp + timedelta(hours=forecast.hours_to_cap_7d)
-                ax1.scatter(limit_time, 100, color=color, marker='x', zorder=5)
-
-    ax1.axhline(100, color='#e03131', linestyle='--', linewidth=2, label='Limit')
-    ax1.set_title('7-Day Overall Utilization')
-    ax1.set_ylabel('Usage %')
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-    plt.setp(ax1.get_xticklabels(), rotation=45, ha='right')
-    ax1.grid(alpha=0.3)
-    ax1.legend(loc='upper left', frameon=False)
-    ax1.set_ylim(0, 110)
-
-    # Panel 2: 7-day Sonnet utilization trend
-    ax2 = fig.add_subplot(gs[0, 1])
-    for account in accounts:
-        acc_data = df[df['account'] == account]
-        if acc_data.empty:
-            continue
-        forecast = forecast_map.get(account)
-        (line,) = ax2.plot(
-            acc_data['queried_at'],
-            acc_data['seven_day_sonnet_utilization'],
-            marker='o',
-            linewidth=2,
-            markersize=3,
-            label=f'{account}',
-        )
-        color = line.get_color()
-        if forecast:
-            if forecast.reset_sonnet_at is not None and not pd.isna(forecast.reset_sonnet_at):
-                ax2.axvline(forecast.reset_sonnet_at, color=color, linestyle=':', alpha=0.35)
-            if forecast.rate_sonnet > 0:
-                horizon = forecast.hours_to_cap_sonnet
-                if forecast.hours_until_sonnet_reset is not None:
-                    horizon = min(horizon, forecast.hours_until_sonnet_reset)
-                if horizon != float('inf') and horizon > 0:
-                    end_time = forecast.latest_timestamp + timedelta(hours=horizon)
-                    end_value = forecast.current_sonnet + forecast.rate_sonnet * horizon
-                    ax2.plot(
-                        [forecast.latest_timestamp, end_time],
-                        [forecast.current_sonnet, min(100, end_value)],
-                        linestyle='--',
-                        color=color,
-                        alpha=0.85,
-                    )
+                ax3.scatter(limit_time, y, marker='x', color='#e03131', s=80, zorder=5)
+                event_times.append(limit_time)
             if forecast.hits_sonnet_before_reset and forecast.hours_to_cap_sonnet != float('inf'):
                 limit_time = forecast.latest_timestamp + timedelta(hours=forecast.hours_to_cap_sonnet)
-                ax2.scatter(limit_time, 100, color=color, marker='x', zorder=5)
-
-    ax2.axhline(100, color='#e03131', linestyle='--', linewidth=2)
-    ax2.set_title('7-Day Sonnet Utilization')
-    ax2.set_ylabel('Usage %')
-    ax2.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-    plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
-    ax2.grid(alpha=0.3)
-    ax2.legend(loc='upper left', frameon=False)
-    ax2.set_ylim(0, 110)
-
-    # Panel 3: Upcoming resets vs limits timeline
-    ax3 = fig.add_subplot(gs[1, 0])
-    y_positions = {account: idx for idx, account in enumerate(accounts)}
-    event_times = []
-    for account in accounts:
-        forecast = forecast_map.get(account)
-        if not forecast:
-            continue
-        y = y_positions[account]
-        if forecast.reset_7d_at is not None and not pd.isna(forecast.reset_7d_at):
-            ax3.scatter(forecast.reset_7d_at, y, marker='^', color='#1c7ed6', s=70, zorder=4)
-            event_times.append(forecast.reset_7d_at)
-        if forecast.reset_sonnet_at is not None and not pd.isna(forecast.reset_sonnet_at):
-            ax3.scatter(forecast.reset_sonnet_at, y, marker='v', color='#7048e8', s=70, zorder=4)
-            event_times.append(forecast.reset_sonnet_at)
-        if forecast.hits_7d_before_reset and forecast.hours_to_cap_7d != float('inf'):
-            limit_time = forecast.latest_timestamp + timedelta(hours=forecast.hours_to_cap_7d)
-            ax3.scatter(limit_time, y, marker='x', color='#e03131', s=80, zorder=5)
-            event_times.append(limit_time)
-        if forecast.hits_sonnet_before_reset and forecast.hours_to_cap_sonnet != float('inf'):
-            limit_time = forecast.latest_timestamp + timedelta(hours=forecast.hours_to_cap_sonnet)
-            ax3.scatter(limit_time, y, marker='x', color='#f59f00', s=80, zorder=5)
-            event_times.append(limit_time)
-
-    if not event_times:
-        event_times = [df['queried_at'].max()]
-    min_time = min(event_times) - timedelta(hours=6)
-    max_time = max(event_times) + timedelta(hours=6)
-
-    ax3.set_yticks(list(y_positions.values()))
-    ax3.set_yticklabels(accounts)
-    ax3.set_ylim(-0.5, len(accounts) - 0.5)
-    ax3.set_xlim(min_time, max_time)
-    ax3.set_xlabel('Date / Time')
-    ax3.set_title('Upcoming Resets vs Limits')
-    ax3.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-    plt.setp(ax3.get_xticklabels(), rotation=45, ha='right')
-    ax3.grid(axis='x', alpha=0.3)
-
-    legend_handles = [
-        Line2D(
-            [0],
-            [0],
-            marker='^',
-            linestyle='',
-            markerfacecolor='#1c7ed6',
-            markeredgecolor='#1c7ed6',
-            markersize=9,
-            label='7d reset',
-        ),
-        Line2D(
-            [0],
-            [0],
-            marker='v',
-            linestyle='',
-            markerfacecolor='#7048e8',
-            markeredgecolor='#7048e8',
-            markersize=9,
-            label='Sonnet reset',
-        ),
-        Line2D(
-            [0],
-            [0],
-            marker='x',
-            linestyle='',
-            color='#e03131',
-            markersize=9,
-            label='7d limit',
-        ),
-        Line2D(
-            [0],
-            [0],
-            marker='x',
-            linestyle='',
-            color='#f59f00',
-            markersize=9,
-            label='Sonnet limit',
-        ),
-    ]
-    ax3.legend(handles=legend_handles, loc='upper left', frameon=False, ncol=2)
-
-    # Panel 4: 5-hour utilization trend
-    ax4 = fig.add_subplot(gs[1, 1])
-    for account in accounts:
-        acc_data = df[df['account'] == account]
-        if acc_data.empty:
-            continue
-        ax4.plot(
-            acc_data['queried_at'],
-            acc_data['five_hour_utilization'],
-            linewidth=2,
-            label=f'{account}',
-        )
-    ax4.axhline(100, color='#e03131', linestyle=':', linewidth=2)
-    ax4.set_title('5-Hour Window Utilization')
-    ax4.set_ylabel('Usage %')
-    ax4.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-    plt.setp(ax4.get_xticklabels(), rotation=45, ha='right')
-    ax4.grid(alpha=0.3)
-    ax4.legend(loc='upper left', frameon=False)
-    ax4.set_ylim(0, 110)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=200, bbox_inches='tight')
+                ax3.scatter(limit_time, y, marker='x', color='#f59f00', s=80, zorder=5)
+                event_times.append(limit_time)
+
+        if not event_times:
+            event_times = [max(f.latest_timestamp for f in forecasts)]
+        min_time = min(event_times) - timedelta(hours=6)
+        max_time = max(event_times) + timedelta(hours=6)
+
+        ax3.set_yticks(range(len(accounts)))
+        ax3.set_yticklabels(accounts)
+        ax3.set_ylim(-0.5, len(accounts) - 0.5)
+        ax3.set_xlim(min_time, max_time)
+        ax3.set_xlabel('Date / Time')
+        ax3.set_title('Upcoming Resets vs Limits')
+        ax3.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        plt.setp(ax3.get_xticklabels(), rotation=45, ha='right')
+        ax3.grid(axis='x', alpha=0.3)
+
+        legend_handles = [
+            Line2D(
+                [0],
+                [0],
+                marker='^',
+                linestyle='',
+                markerfacecolor='#1c7ed6',
+                markeredgecolor='#1c7ed6',
+                markersize=9,
+                label='7d reset',
+            ),
+            Line2D(
+                [0],
+                [0],
+                marker='v',
+                linestyle='',
+                markerfacecolor='#7048e8',
+                markeredgecolor='#7048e8',
+                markersize=9,
+                label='Sonnet reset',
+            ),
+            Line2D(
+                [0],
+                [0],
+                marker='x',
+                linestyle='',
+                color='#e03131',
+                markersize=9,
+                label='7d limit',
+            ),
+            Line2D(
+                [0],
+                [0],
+                marker='x',
+                linestyle='',
+                color='#f59f00',
+                markersize=9,
+                label='Sonnet limit',
+            ),
+        ]
+        ax3.legend(handles=legend_handles, loc='upper left', frameon=False, ncol=2)
+
+        # Panel 4: 5-hour utilization trend
+        ax4 = fig.add_subplot(gs[1, 1])
+        _plot_utilization_panel(ax4, forecasts, series, '5h', '5-Hour Window Utilization', limit_style=':')
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    if fingerprint is not None:
+        USAGE_CHART_HASH_PATH.parent.mkdir(parents=True, exist_ok=True)
+        USAGE_CHART_HASH_PATH.write_text(fingerprint)
+    else:
+        # A stored fingerprint may no longer describe the overwritten chart
+        USAGE_CHART_HASH_PATH.unlink(missing_ok=True)
     console.print(f'[bold green]✓[/] Saved visualization to [link=file://{output_path}]{output_path}[/]')
     if output_path.exists():
         console.print(f'[dim]Figure size: {output_path.stat().st_size / 1024:.1f} KiB[/]')
@@ -749,18 +881,18 @@ def generate_usage_report(
         return
 
     console.print(f'[bold cyan]Loading usage history from[/] {db_path}')
-    df = load_usage_history(db_path)
+    # Charts cover the last 7 days, or the fit window if longer
+    chart_start_sec = math.ceil(time.time() - max(window_hours, 7 * 24) * 3600)
+    df = load_usage_history(db_path, window_hours, chart_start_sec)
 
     if df.empty:
         console.print('[yellow]No usage history found.[/]')
         return
 
-    forecasts: list[AccountForecast] = []
-    for account in df['account'].unique():
-        acc_df = df[df['account'] == account]
-        forecast = forecast_account(acc_df, window_hours)
-        if forecast:
-            forecasts.append(forecast)
+    # Align each account's latest sample with the burn rates' first-seen order
+    rates = fit_burn_rates(df, window_hours)
+    latest = df.groupby('account', sort=False, observed=True).tail(1).set_index('account', drop=False)
+    forecasts = forecast_accounts(latest.loc[rates.index], rates)
 
     if not forecasts:
         console.print('[yellow]Not enough data to produce a forecast.[/]')
@@ -777,8 +909,7 @@ def generate_usage_report(
         if f.first_limit_type:
             horizon = f.first_limit_hours
         else:
-            reset_candidates = [val for val in (f.hours_until_7d_reset, f.hours_until_sonnet_reset) if val is not None]
-            horizon = min(reset_candidates) if reset_candidates else float('inf')
+            horizon = f.hours_until_next_reset if f.hours_until_next_reset is not None else float('inf')
         return (
             severity_order.get(f.status, 2),
             horizon,
@@ -797,4 +928,6 @@ def generate_usage_report(
     console.print(playbook_panel(forecasts, metrics))
 
     console.print('\n[bold cyan]Building visualization…[/]')
-    create_visualizations(df, forecasts, output_path, show)
+    # Older rows were loaded only for the fits of stale or sparse accounts
+    chart_df = df[df['queried_at'] >= np.datetime64(chart_start_sec, 's')]
+    create_visualizations(chart_df, forecasts, output_path, show)
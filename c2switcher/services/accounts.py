@@ -38,7 +38,7 @@ class AccountService:
         """
         # Validate and refresh credentials
         self.credential_store.parse_credentials(credentials_json)
-        refreshed = self.credential_store.refresh_access_token(credentials_json, force=False)
+        refreshed, _ = self.credential_store.refresh_access_token(credentials_json, force=False)
         token = refreshed.get('claudeAiOauth', {}).get('accessToken')
 
         if not token:
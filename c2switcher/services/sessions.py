@@ -149,6 +149,10 @@ class SessionService:
         Args:
            interval_seconds: Minimum seconds between cleanups
         """
+        # Nothing to reap; skip the marker stat/touch entirely
+        if not self.store.list_active_sessions():
+            return
+
         now = time.time()
         should_cleanup = True
 
@@ -151,7 +151,7 @@ class SwitchingService:
             refreshed_creds = selected.account.get_credentials()
         else:
             # Refresh credentials to ensure valid token for switching/token-only flows
-            refreshed_creds = self.credential_store.refresh_access_token(selected.account.credentials_json)
+            refreshed_creds, _ = self.credential_store.refresh_access_token(selected.account.credentials_json)
 
             if not token_only:
                 self.credential_store.write_credentials_for_account(selected.account, refreshed_creds)
@@ -179,7 +179,7 @@ class SwitchingService:
         if not account:
             raise NoAccountsAvailable(f'Account not found: {identifier}')
 
-        refreshed_creds = self.credential_store.refresh_access_token(account.credentials_json)
+        refreshed_creds, _ = self.credential_store.refresh_access_token(account.credentials_json)
 
         if not token_only:
             self.credential_store.write_credentials_for_account(account, refreshed_creds)
@@ -341,7 +341,7 @@ class SwitchingService:
         Falls back to cached data (up to 24h old) if API returns all null fields,
         which happens intermittently due to an Anthropic API bug.
         """
-        refreshed_creds = self.credential_store.refresh_access_token(account.credentials_json)
+        refreshed_creds, _ = self.credential_store.refresh_access_token(account.credentials_json)
         token = refreshed_creds.get('claudeAiOauth', {}).get('accessToken')
 
         if not token:
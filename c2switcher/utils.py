@@ -23,6 +23,14 @@ def mask_email(email: str) -> str:
     return f'{masked_local}@{domain}'
 
 
+def parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+    if value.endswith('Z'):
+        # Python < 3.11 rejects the 'Z' suffix the API uses
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
 def format_time_until_reset(
     opus_resets_at: Optional[str],
     overall_resets_at: Optional[str],
@@ -36,7 +44,7 @@ def format_time_until_reset(
         return '[dim]--[/dim]'
 
     try:
-        reset_dt = datetime.fromisoformat(display_reset.replace('Z', '+00:00'))
+        reset_dt = parse_iso_timestamp(display_reset)
         if reset_dt.tzinfo is None:
             reset_dt = reset_dt.replace(tzinfo=timezone.utc)
 
@@ -65,7 +73,7 @@ def format_time_until_reset(
 
             if opus_usage is not None and opus_resets_at:
                 try:
-                    opus_reset_dt = datetime.fromisoformat(opus_resets_at.replace('Z', '+00:00'))
+                    opus_reset_dt = parse_iso_timestamp(opus_resets_at)
                     if opus_reset_dt.tzinfo is None:
                         opus_reset_dt = opus_reset_dt.replace(tzinfo=timezone.utc)
 
@@ -81,7 +89,7 @@ def format_time_until_reset(
 
             if overall_usage is not None and overall_resets_at:
                 try:
-                    overall_reset_dt = datetime.fromisoformat(overall_resets_at.replace('Z', '+00:00'))
+                    overall_reset_dt = parse_iso_timestamp(overall_resets_at)
                     if overall_reset_dt.tzinfo is None:
                         overall_reset_dt = overall_reset_dt.replace(tzinfo=timezone.utc)
 
@@ -149,7 +157,7 @@ def atomic_write_json(path: Path, data: Dict[str, Any], preserve_permissions: bo
 def parse_sqlite_timestamp_to_local(timestamp: Any) -> datetime:
     """Convert a SQLite timestamp to naive local datetime."""
     if isinstance(timestamp, str):
-        dt_utc = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        dt_utc = parse_iso_timestamp(timestamp)
         if dt_utc.tzinfo is None:
             dt_utc = dt_utc.replace(tzinfo=timezone.utc)
         return dt_utc.astimezone().replace(tzinfo=None)
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from c2switcher.reports.sessions import WEEKDAYS, account_mix_table, build_report_context, project_detail_table
+
+
+def _sessions() -> pd.DataFrame:
+    created_at = pd.DatetimeIndex(['2025-01-06 09:00', '2025-01-06 14:00', '2025-01-08 09:30'])
+    return pd.DataFrame(
+        {
+            'session_id': np.array(['s1', 's2', 's3'], dtype=object),
+            'created_at': created_at,
+            'duration_sec': np.array([3600, 1800, 600], dtype=np.int32),
+            # Each categorical carries a category no session uses
+            'project': pd.Categorical(['api', 'web', 'api'], categories=['api', 'web', 'unused']),
+            'account': pd.Categorical(['alpha', 'beta', 'alpha'], categories=['alpha', 'beta', 'ghost']),
+            'date': created_at.values.astype('datetime64[D]'),
+            'hour': created_at.hour.to_numpy().astype(np.int8),
+            'weekday': pd.Categorical(['Monday', 'Monday', 'Wednesday'], categories=WEEKDAYS, ordered=True),
+        }
+    )
+
+
+def test_unused_categories_produce_no_rows():
+    ctx = build_report_context(_sessions(), datetime(2025, 1, 9))
+
+    assert list(ctx.accounts.index) == ['alpha', 'beta']
+    assert set(ctx.projects.index) == {'api', 'web'}
+    assert account_mix_table(ctx).row_count == 2
+    assert project_detail_table(ctx).row_count == 2
+    assert set(ctx.hour_signature.index) == {9, 14}
+
+
+def test_unused_weekdays_stay_empty():
+    ctx = build_report_context(_sessions(), datetime(2025, 1, 9))
+
+    used = [WEEKDAYS.index('Monday'), WEEKDAYS.index('Wednesday')]
+    unused = [day for day in range(len(WEEKDAYS)) if day not in used]
+    assert ctx.metrics.busiest_day == 'Monday'
+    assert ctx.weekday_hour[used].sum() == (3600 + 1800 + 600) / 60
+    assert not ctx.weekday_hour[unused].any()
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from c2switcher.reports.usage import fit_burn_rates
+
+
+def _history(account_series: dict) -> pd.DataFrame:
+    frames = []
+    for account, (seven_day, sonnet) in account_series.items():
+        frames.append(
+            pd.DataFrame(
+                {
+                    'account': account,
+                    'queried_at': pd.Timestamp('2025-01-01') + pd.to_timedelta(np.arange(len(seven_day)), unit='h'),
+                    'seven_day_utilization': np.array(seven_day, dtype=np.float32),
+                    'seven_day_sonnet_utilization': np.array(sonnet, dtype=np.float32),
+                }
+            )
+        )
+    df = pd.concat(frames, ignore_index=True).sort_values('queried_at', kind='stable', ignore_index=True)
+    df['account'] = df['account'].astype('category')
+    return df
+
+
+def test_fit_burn_rates_skips_missing_readings():
+    df = _history(
+        {
+            'alpha': ([0, 1, 2, 3, 4, 5], [0, 1, 2, np.nan, 4, 5]),
+            'beta': ([10, 12, 14, 16, 18, 20], [5, 5, 5, 5, 5, 5]),
+        }
+    )
+
+    rates = fit_burn_rates(df, window_hours=24)
+
+    assert rates.loc['alpha', 'rate_7d'] == pytest.approx(1.0)
+    assert rates.loc['alpha', 'rate_sonnet'] == pytest.approx(1.0)
+    assert rates.loc['beta', 'rate_7d'] == pytest.approx(2.0)
+    assert rates.loc['beta', 'rate_sonnet'] == 0.0
+
+
+def test_fit_burn_rates_needs_two_valid_readings():
+    df = _history({'alpha': ([0, 1, 2], [np.nan, 3, np.nan])})
+
+    rates = fit_burn_rates(df, window_hours=24)
+
+    assert rates.loc['alpha', 'rate_7d'] == pytest.approx(1.0)
+    assert rates.loc['alpha', 'rate_sonnet'] == 0.0